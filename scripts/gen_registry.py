@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+"""Regenerate src/validate_secrets/core/_registry_table.py.
+
+Run this after adding, renaming or removing a validator module:
+
+    python scripts/gen_registry.py
+"""
+
+import sys
+from pathlib import Path
+
+SRC_PATH = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC_PATH))
+
+from validate_secrets.core.registry import discover_validators  # noqa: E402
+
+TABLE_PATH = SRC_PATH / "validate_secrets" / "core" / "_registry_table.py"
+
+HEADER = '''"""Validator lookup table, generated by scripts/gen_registry.py. Do not edit by hand.
+
+Maps each validator name to the module (relative to the validators package) and class
+implementing it, so the registry can import a single validator without scanning the
+validators package.
+"""
+
+TABLE = {
+'''
+
+
+def main():
+    """Write the lookup table for the validators currently on disk."""
+    lines = [HEADER]
+    for name, (module_name, class_name) in discover_validators().items():
+        module = module_name.rpartition(".")[2]
+        lines.append(f'    "{name}": ("{module}", "{class_name}"),\n')
+    lines.append("}\n")
+
+    TABLE_PATH.write_text("".join(lines))
+    print(f"Wrote {TABLE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@
 import sys
 import inspect
 import logging
+from contextlib import contextmanager
 
 import click
 from rich.console import Console
@@ -16,8 +17,11 @@ from .core.registry import (
     get_validator,
     list_validators as list_available_validators,
     get_validator_info,
+    validator_names,
 )
+from .core.cache import ResultStore
 from .core.exceptions import ConfigurationError
+from .sources.dedup import DedupSource
 from .sources.file import FileSource
 from .sources.github import GitHubSource
 from .utils import output_results
@@ -25,16 +29,174 @@ from .utils import output_results
 LOG = logging.getLogger(__name__)
 console = Console()
 
+# Resolved once at import and shared by every command that takes a secret type
+VALIDATOR_NAMES = list_available_validators()
 
-def _create_validator(validator_class, **kwargs):
+
+def _create_validator(validator_class, result_store=None, **kwargs):
     """Create a validator instance, only passing kwargs it accepts.
 
     This allows validator-specific options like host_url to be passed
-    without breaking validators that don't accept them.
+    without breaking validators that don't accept them. result_store is a
+    callable returning the store, so it is only opened once a validator needs it.
     """
     sig = inspect.signature(validator_class.__init__)
     valid_kwargs = {k: v for k, v in kwargs.items() if k in sig.parameters}
-    return validator_class(**valid_kwargs)
+    validator = validator_class(**valid_kwargs)
+    store = result_store() if result_store is not None else None
+    if store is not None:
+        validator.result_store = store
+    return validator
+
+
+@contextmanager
+def _result_store(validation_config):
+    """Yield a getter for the result store shared between runs.
+
+    The store is opened on first use, if a cache directory is configured, and
+    closed when the command finishes so pending writes are committed.
+    """
+    store = None
+
+    def get_store():
+        nonlocal store
+        if store is None and validation_config["cache_dir"]:
+            store = ResultStore(validation_config["cache_dir"], validation_config["cache_ttl"])
+        return store
+
+    try:
+        yield get_store
+    finally:
+        if store is not None:
+            store.close()
+
+
+def _check_secrets(validator, secrets, max_workers, description):
+    """Validate each distinct secret once and return the statuses keyed by secret.
+
+    The same leaked secret is often reported many times, so duplicates are
+    collapsed before any request is made.
+    """
+    unique_secrets = list(dict.fromkeys(secrets))
+
+    statuses = validator.check_many(unique_secrets, max_workers=max_workers)
+    return dict(
+        track(zip(unique_secrets, statuses), total=len(unique_secrets), description=description)
+    )
+
+
+def _status_text(status):
+    """Map a check() result to its output status."""
+    if status is True:
+        return "valid"
+    if status is None:
+        return "error"
+    return "invalid"
+
+
+def _file_results(secrets_by_type, validator_kwargs, concurrency):
+    """Validate file secrets grouped by type, yielding one result per secret."""
+    for current_secret_type, secret_list in secrets_by_type.items():
+        try:
+            # Get validator for this secret type
+            validator_class = get_validator(current_secret_type)
+            validator = _create_validator(validator_class, **validator_kwargs)
+
+            status_by_secret = _check_secrets(
+                validator,
+                [s["secret"] for s in secret_list],
+                concurrency,
+                f"Validating {current_secret_type}...",
+            )
+        except Exception as validator_error:
+            console.print(
+                f"[red]Error with validator for {current_secret_type}: {validator_error}[/red]"
+            )
+            # Add error results for these secrets
+            for secret_data in secret_list:
+                yield {
+                    "secret": secret_data["secret"],
+                    "type": current_secret_type,
+                    "status": "error",
+                    "metadata": secret_data.get("metadata", {}),
+                }
+            continue
+
+        for secret_data in secret_list:
+            secret = secret_data["secret"]
+            yield {
+                "secret": secret,
+                "type": current_secret_type,
+                "status": _status_text(status_by_secret[secret]),
+                "metadata": secret_data.get("metadata", {}),
+            }
+
+
+def _alert_errors(alert_list, github_secret_type, status, error_msg):
+    """Yield a result with the given error status for each alert."""
+    for alert_data in alert_list:
+        yield {
+            "secret": alert_data["secret"],
+            "type": github_secret_type,
+            "status": status,
+            "error": error_msg,
+            "metadata": alert_data.get("metadata", {}),
+        }
+
+
+def _github_results(alerts_by_type, validator_kwargs, concurrency):
+    """Validate GitHub alerts grouped by type, yielding one result per alert."""
+    known_types = validator_names()
+
+    for github_secret_type, alert_list in alerts_by_type.items():
+        # Most unknown types are plain set misses, so no ValidatorError is raised for them
+        if github_secret_type not in known_types:
+            console.print(
+                f"[yellow]No validator available for secret type: {github_secret_type}[/yellow]"
+            )
+            yield from _alert_errors(
+                alert_list,
+                github_secret_type,
+                "no_validator",
+                f"Unknown validator '{github_secret_type}'",
+            )
+            continue
+
+        try:
+            # Try to get validator using the GitHub secret type directly
+            validator_class = get_validator(github_secret_type)
+            validator = _create_validator(validator_class, **validator_kwargs)
+
+            status_by_secret = _check_secrets(
+                validator,
+                [a["secret"] for a in alert_list],
+                concurrency,
+                f"Validating {github_secret_type}...",
+            )
+        except Exception as e:
+            error_msg = str(e)
+            if "Unknown validator" in error_msg:
+                status = "no_validator"
+                console.print(
+                    f"[yellow]No validator available for secret type: {github_secret_type}[/yellow]"
+                )
+            else:
+                status = "validation_error"
+                console.print(
+                    f"[yellow]Warning: Failed to validate {github_secret_type} secret: {e}[/yellow]"
+                )
+
+            yield from _alert_errors(alert_list, github_secret_type, status, error_msg)
+            continue
+
+        for alert_data in alert_list:
+            yield {
+                "secret": alert_data["secret"],
+                "type": github_secret_type,
+                "status": _status_text(status_by_secret[alert_data["secret"]]),
+                "validator": github_secret_type,
+                "metadata": alert_data.get("metadata", {}),
+            }
 
 
 @click.group()
@@ -64,7 +226,7 @@ def cli(ctx, config, debug):
 
 @cli.command()
 @click.argument("file_path", type=click.Path(exists=True))
-@click.argument("secret_type", type=click.Choice(list_available_validators()), required=False)
+@click.argument("secret_type", type=click.Choice(VALIDATOR_NAMES), required=False)
 @click.option("--output", "-o", help="Output file (default: stdout)")
 @click.option(
     "--format",
@@ -84,17 +246,37 @@ def cli(ctx, config, debug):
     "--host-url",
     help="Base URL of the service to validate against (only used by validators that require it)",
 )
+@click.option(
+    "--dedupe",
+    is_flag=True,
+    help="Report each distinct secret once, listing repeat occurrences under metadata.duplicates",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    help="Maximum checks in flight per secret type (default: VALIDATION_CONCURRENCY)",
+)
 @click.pass_context
-def check_file(ctx, file_path, secret_type, output, output_format, file_format, notify, host_url):
+def check_file(
+    ctx,
+    file_path,
+    secret_type,
+    output,
+    output_format,
+    file_format,
+    notify,
+    host_url,
+    dedupe,
+    concurrency,
+):
     """Check secrets from a file."""
     try:
         config = ctx.obj["config"]
-        validation_config = config.get_validation_config()
+        validation_config = config.validation_config
 
         # Get default file format from config if not provided via CLI
         if file_format is None:
-            input_config = config.get_input_format()
-            file_format = input_config["input_format"]
+            file_format = config.input_config["input_format"]
 
         # Validate secret_type requirement for text files
         if file_format == "text" and not secret_type:
@@ -106,9 +288,10 @@ def check_file(ctx, file_path, secret_type, output, output_format, file_format,
 
         # Create file source
         source = FileSource(file_path, file_format, secret_type)
+        if dedupe:
+            source = DedupSource(source)
 
         # Process secrets
-        results = []
         secret_count = 0
         secrets_by_type = {}
 
@@ -132,55 +315,22 @@ def check_file(ctx, file_path, secret_type, output, output_format, file_format,
 
         console.print(f"Processing {secret_count} secrets...")
 
-        # Validate secrets by type
-        for current_secret_type, secret_list in secrets_by_type.items():
-            try:
-                # Get validator for this secret type
-                validator_class = get_validator(current_secret_type)
-                validator = _create_validator(
-                    validator_class,
-                    notify=notify or validation_config["notifications"],
-                    debug=ctx.obj["debug"],
-                    timeout=validation_config["timeout"],
-                    host_url=host_url,
-                )
+        with _result_store(validation_config) as result_store:
+            validator_kwargs = {
+                "notify": notify or validation_config["notifications"],
+                "debug": ctx.obj["debug"],
+                "timeout": validation_config["timeout"],
+                "host_url": host_url,
+                "result_store": result_store,
+            }
+
+            # Results are streamed to the output as each type is validated
+            results = _file_results(
+                secrets_by_type, validator_kwargs, concurrency or validation_config["concurrency"]
+            )
 
-                for secret_data in track(
-                    secret_list, description=f"Validating {current_secret_type}..."
-                ):
-                    secret = secret_data["secret"]
-                    status = validator.check(secret)
-
-                    status_text = "invalid"
-                    if status is True:
-                        status_text = "valid"
-                    elif status is None:
-                        status_text = "error"
-
-                    result = {
-                        "secret": secret,
-                        "type": current_secret_type,
-                        "status": status_text,
-                        "metadata": secret_data.get("metadata", {}),
-                    }
-                    results.append(result)
-
-            except Exception as validator_error:
-                console.print(
-                    f"[red]Error with validator for {current_secret_type}: {validator_error}[/red]"
-                )
-                # Add error results for these secrets
-                for secret_data in secret_list:
-                    result = {
-                        "secret": secret_data["secret"],
-                        "type": current_secret_type,
-                        "status": "error",
-                        "metadata": secret_data.get("metadata", {}),
-                    }
-                    results.append(result)
-
-        # Output results
-        output_results(results, output, output_format)
+            # Output results
+            output_results(results, output, output_format)
 
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -214,15 +364,36 @@ def check_file(ctx, file_path, secret_type, output, output_format, file_format,
     "--host-url",
     help="Base URL of the service to validate against (only used by validators that require it)",
 )
+@click.option(
+    "--dedupe",
+    is_flag=True,
+    help="Report each distinct secret once, listing repeat occurrences under metadata.duplicates",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    help="Maximum checks in flight per secret type (default: VALIDATION_CONCURRENCY)",
+)
 @click.pass_context
 def check_github(
-    ctx, org, repo, secret_type, state, validity, output, output_format, notify, host_url
+    ctx,
+    org,
+    repo,
+    secret_type,
+    state,
+    validity,
+    output,
+    output_format,
+    notify,
+    host_url,
+    dedupe,
+    concurrency,
 ):
     """Check secrets from GitHub secret scanning alerts."""
     try:
         config = ctx.obj["config"]
-        github_config = config.get_github_config()
-        validation_config = config.get_validation_config()
+        github_config = config.github_config
+        validation_config = config.validation_config
 
         # Use CLI args or fallback to config
         org = org or github_config.get("org")
@@ -244,6 +415,9 @@ def check_github(
             validity=validity,
         )
 
+        if dedupe:
+            source = DedupSource(source)
+
         console.print(f"Fetching alerts from {source.get_name()}...")
 
         # Get all alerts
@@ -255,65 +429,27 @@ def check_github(
 
         console.print(f"Found {len(alerts)} alerts")
 
-        # Process alerts and validate secrets
-        results = []
-
-        for alert_data in track(alerts, description="Validating..."):
-            secret = alert_data["secret"]
-            github_secret_type = alert_data["type"]
-
-            try:
-                # Try to get validator using the GitHub secret type directly
-                validator_class = get_validator(github_secret_type)
-                validator = _create_validator(
-                    validator_class,
-                    notify=notify or validation_config["notifications"],
-                    debug=ctx.obj["debug"],
-                    timeout=validation_config["timeout"],
-                    host_url=host_url,
-                )
-
-                status = validator.check(secret)
-
-                status_text = "invalid"
-                if status is True:
-                    status_text = "valid"
-                elif status is None:
-                    status_text = "error"
-
-                result = {
-                    "secret": secret,
-                    "type": github_secret_type,
-                    "status": status_text,
-                    "validator": github_secret_type,
-                    "metadata": alert_data.get("metadata", {}),
-                }
-                results.append(result)
-
-            except Exception as e:
-                error_msg = str(e)
-                if "Unknown validator" in error_msg:
-                    status = "no_validator"
-                    console.print(
-                        f"[yellow]No validator available for secret type: {github_secret_type}[/yellow]"
-                    )
-                else:
-                    status = "validation_error"
-                    console.print(
-                        f"[yellow]Warning: Failed to validate {github_secret_type} secret: {e}[/yellow]"
-                    )
-
-                result = {
-                    "secret": secret,
-                    "type": github_secret_type,
-                    "status": status,
-                    "error": error_msg,
-                    "metadata": alert_data.get("metadata", {}),
-                }
-                results.append(result)
+        # Group alerts by type so each validator (and its HTTP session) is created once
+        alerts_by_type = {}
+        for alert_data in alerts:
+            alerts_by_type.setdefault(alert_data["type"], []).append(alert_data)
+
+        with _result_store(validation_config) as result_store:
+            validator_kwargs = {
+                "notify": notify or validation_config["notifications"],
+                "debug": ctx.obj["debug"],
+                "timeout": validation_config["timeout"],
+                "host_url": host_url,
+                "result_store": result_store,
+            }
+
+            # Results are streamed to the output as each type is validated
+            results = _github_results(
+                alerts_by_type, validator_kwargs, concurrency or validation_config["concurrency"]
+            )
 
-        # Output results
-        output_results(results, output, output_format)
+            # Output results
+            output_results(results, output, output_format)
 
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -345,7 +481,7 @@ def list_validators_cmd():
 
 @cli.command()
 @click.argument("secret")
-@click.argument("secret_type", type=click.Choice(list_available_validators()))
+@click.argument("secret_type", type=click.Choice(VALIDATOR_NAMES))
 @click.option("--notify", "-n", is_flag=True, help="Send notifications to endpoints")
 @click.option(
     "--host-url",
@@ -356,21 +492,24 @@ def validate(ctx, secret, secret_type, notify, host_url):
     """Validate a single secret."""
     try:
         config = ctx.obj["config"]
-        validation_config = config.get_validation_config()
+        validation_config = config.validation_config
 
         # Get validator
         validator_class = get_validator(secret_type)
-        validator = _create_validator(
-            validator_class,
-            notify=notify or validation_config["notifications"],
-            debug=ctx.obj["debug"],
-            timeout=validation_config["timeout"],
-            host_url=host_url,
-        )
 
-        # Validate secret
-        with console.status("Validating secret..."):
-            status = validator.check(secret)
+        with _result_store(validation_config) as result_store:
+            validator = _create_validator(
+                validator_class,
+                notify=notify or validation_config["notifications"],
+                debug=ctx.obj["debug"],
+                timeout=validation_config["timeout"],
+                host_url=host_url,
+                result_store=result_store,
+            )
+
+            # Validate secret
+            with console.status("Validating secret..."):
+                status = validator.check(secret)
 
         if status is True:
             console.print("[green]✓ Secret is valid[/green]")
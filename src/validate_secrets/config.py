@@ -2,6 +2,7 @@
 
 import os
 import logging
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
@@ -11,6 +12,18 @@ from .core.exceptions import ConfigurationError
 LOG = logging.getLogger(__name__)
 
 
+def _positive_int(name: str, default: str) -> int:
+    """Read an environment variable that must be an integer of at least 1."""
+    value = os.getenv(name, default)
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise ConfigurationError(f"{name} must be a positive integer, got {value!r}")
+    return number
+
+
 class Config:
     """Configuration manager for validate-secrets."""
 
@@ -24,9 +37,10 @@ class Config:
         env_path = Path(env_file) if env_file else Path(".env")
         if env_path.exists():
             load_dotenv(env_path)
-            LOG.debug(f"Loaded configuration from {env_path}")
+            LOG.debug("Loaded configuration from %s", env_path)
 
-    def get_github_config(self) -> Dict[str, Any]:
+    @cached_property
+    def github_config(self) -> Dict[str, Any]:
         """Get GitHub configuration from environment."""
         token = os.getenv("GITHUB_TOKEN")
         if not token:
@@ -39,36 +53,43 @@ class Config:
             "api_url": os.getenv("GITHUB_API_URL", "https://api.github.com"),
         }
 
-    def get_log_config(self) -> Dict[str, Any]:
+    @cached_property
+    def log_config(self) -> Dict[str, Any]:
         """Get logging configuration from environment."""
         level = os.getenv("LOG_LEVEL", "INFO").upper()
         format_type = os.getenv("LOG_FORMAT", "text").lower()
 
         return {"level": getattr(logging, level, logging.INFO), "format": format_type}
 
-    def get_output_config(self) -> Dict[str, Any]:
+    @cached_property
+    def output_config(self) -> Dict[str, Any]:
         """Get output configuration from environment."""
         return {
             "format": os.getenv("DEFAULT_OUTPUT_FORMAT", "csv").lower(),
             "file": os.getenv("DEFAULT_OUTPUT_FILE", "stdout"),
         }
 
-    def get_input_format(self) -> Dict[str, Any]:
+    @cached_property
+    def input_config(self) -> Dict[str, Any]:
         """Get input format configuration from environment."""
         return {
             "input_format": os.getenv("DEFAULT_INPUT_FORMAT", "text").lower(),
         }
 
-    def get_validation_config(self) -> Dict[str, Any]:
+    @cached_property
+    def validation_config(self) -> Dict[str, Any]:
         """Get validation configuration from environment."""
         return {
             "timeout": int(os.getenv("VALIDATION_TIMEOUT", "30")),
+            "concurrency": _positive_int("VALIDATION_CONCURRENCY", "32"),
+            "cache_dir": os.getenv("VALIDATION_CACHE_DIR", ""),
+            "cache_ttl": int(os.getenv("VALIDATION_CACHE_TTL", "86400")),
             "notifications": os.getenv("ENABLE_NOTIFICATIONS", "false").lower() == "true",
         }
 
     def setup_logging(self) -> None:
         """Set up logging based on configuration."""
-        log_config = self.get_log_config()
+        log_config = self.log_config
 
         if log_config["format"] == "json":
             log_format = '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "module": "%(name)s", "message": "%(message)s"}'
@@ -0,0 +1,14 @@
+"""Validator lookup table, generated by scripts/gen_registry.py. Do not edit by hand.
+
+Maps each validator name to the module (relative to the validators package) and class
+implementing it, so the registry can import a single validator without scanning the
+validators package.
+"""
+
+TABLE = {
+    "databricks_token": ("databricks_token", "DatabricksTokenChecker"),
+    "fodselsnummer": ("fodselsnummer", "FodselsNummerChecker"),
+    "google_api_key": ("google_api_keys", "GoogleApiKeyChecker"),
+    "microsoft_teams_webhook": ("microsoft_teams_webhook", "OfficeWebHookChecker"),
+    "snyk_api_token": ("snyk_api_token", "SnykAPITokenChecker"),
+}
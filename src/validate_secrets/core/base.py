@@ -1,47 +1,69 @@
 """Base classes for validators."""
 
+import time
+import hashlib
 import logging
-from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
-import threading
 import functools
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterable, Iterator, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor
 
-from .exceptions import ValidationTimeoutError
+if TYPE_CHECKING:
+    from .cache import ResultStore
 
 LOG = logging.getLogger(__name__)
 
+# Seconds allowed for establishing a connection, independent of the read timeout.
+# Just over a multiple of 3 s, the initial TCP retransmission window.
+CONNECT_TIMEOUT = 3.05
+
+# Number of check results each validator instance remembers
+RESULT_CACHE_SIZE = 4096
+
+# Checks check_many keeps queued per worker thread, bounding memory on large inputs
+IN_FLIGHT_PER_WORKER = 2
+
 
-def with_timeout(timeout_seconds: int = 30):
-    """Decorator to add timeout to validation methods (cross-platform)."""
+def cached_check(
+    check: Callable[[Any, str], Optional[bool]],
+) -> Callable[[Any, str], Optional[bool]]:
+    """Decorator that remembers the result of a validator's check() per secret.
 
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            result = [None]
-            exception = [None]
+    The same leaked secret often shows up in many alerts and files, so repeat
+    checks are answered without another request. Results are keyed by a blake2b
+    digest so the cache never holds the secret itself, and errors (None) are not
+    cached so they are retried. When the validator has a result_store, results
+    are also shared with later runs, except while notifying so owners are still told.
+    """
 
-            def target():
-                try:
-                    result[0] = func(*args, **kwargs)
-                except Exception as e:
-                    exception[0] = e
+    @functools.wraps(check)
+    def wrapper(self, secret: str) -> Optional[bool]:
+        key = hashlib.blake2b(secret.encode("utf-8"), digest_size=16).digest()
 
-            thread = threading.Thread(target=target)
-            thread.daemon = True
-            thread.start()
-            thread.join(timeout_seconds)
+        with self._result_cache_lock:
+            if key in self._result_cache:
+                self._result_cache.move_to_end(key)
+                return self._result_cache[key]
 
-            if thread.is_alive():
-                raise ValidationTimeoutError("Validation timed out")
+        store = None if self.notify else self.result_store
 
-            if exception[0]:
-                raise exception[0]
+        result = store.get(self.cache_namespace, key) if store is not None else None
+        if result is None:
+            result = check(self, secret)
+            if result is not None and store is not None:
+                store.put(self.cache_namespace, key, result)
 
-            return result[0]
+        if result is not None:
+            with self._result_cache_lock:
+                self._result_cache[key] = result
+                if len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
 
-        return wrapper
+        return result
 
-    return decorator
+    return wrapper
 
 
 class Checker(ABC):
@@ -54,6 +76,9 @@ class Checker(ABC):
     name: str = ""
     description: str = ""
 
+    # Optional persistent store used by check() methods decorated with cached_check
+    result_store: Optional["ResultStore"] = None
+
     def __init__(self, notify: bool = False, debug: bool = False, timeout: int = 30) -> None:
         """Initialize the checker.
 
@@ -66,9 +91,38 @@ class Checker(ABC):
         self.debug = debug
         self.timeout = timeout
 
+        # Used by check() methods decorated with cached_check
+        self._result_cache: "OrderedDict[bytes, bool]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+
         if self.debug:
             logging.getLogger().setLevel(logging.DEBUG)
 
+    @property
+    def cache_namespace(self) -> str:
+        """Name results are filed under in the result store.
+
+        Validators whose results depend on constructor arguments, such as the host
+        a token belongs to, include those arguments so results are never shared
+        between them.
+        """
+        return self.name
+
+    @property
+    def http_timeout(self) -> Tuple[float, float]:
+        """(connect, read) timeout to pass to HTTP calls made by the validator."""
+        return (min(CONNECT_TIMEOUT, self.timeout), self.timeout)
+
+    def timeout_until(self, deadline: float) -> Tuple[float, float]:
+        """(connect, read) timeout for an HTTP call that must finish by deadline.
+
+        Validators making several requests per check compute the deadline once,
+        as time.monotonic() + self.timeout, so the whole check stays within the
+        configured timeout. Safe to use from worker threads, unlike signal alarms.
+        """
+        remaining = max(0.1, deadline - time.monotonic())
+        return (min(CONNECT_TIMEOUT, remaining), remaining)
+
     @abstractmethod
     def check(self, secret: str) -> Optional[bool]:
         """Check if a secret is valid.
@@ -81,13 +135,45 @@ class Checker(ABC):
         """
         pass
 
-    def get_metadata(self) -> Dict[str, Any]:
-        """Get validator metadata."""
+    def check_many(self, secrets: Iterable[str], max_workers: int = 32) -> Iterator[Optional[bool]]:
+        """Check many secrets concurrently.
+
+        Most validators are bound by network latency, so checks are overlapped
+        on a thread pool. Validators with a cheaper batch strategy can override this.
+        Secrets are submitted as results are consumed, with at most
+        IN_FLIGHT_PER_WORKER * max_workers pending, so a large input is never
+        queued on the pool all at once.
+
+        Args:
+            secrets: The secret strings to validate
+            max_workers: Maximum number of checks in flight
+
+        Yields:
+            The result of check() for each secret, in input order
+        """
+        window = max_workers * IN_FLIGHT_PER_WORKER
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for secret in secrets:
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(self.check, secret))
+
+            while pending:
+                yield pending.popleft().result()
+
+    @classmethod
+    def get_metadata(cls) -> Dict[str, Any]:
+        """Get validator metadata.
+
+        Metadata only depends on class attributes, so no instance is needed.
+        """
         return {
-            "name": self.name or self.__class__.__name__.lower().replace("checker", ""),
-            "description": self.description or f"Validates {self.name or 'secrets'}",
-            "class": self.__class__.__name__,
-            "module": self.__module__,
+            "name": cls.name or cls.__name__.lower().replace("checker", ""),
+            "description": cls.description or f"Validates {cls.name or 'secrets'}",
+            "class": cls.__name__,
+            "module": cls.__module__,
         }
 
     def __str__(self) -> str:
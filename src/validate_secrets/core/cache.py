@@ -0,0 +1,71 @@
+"""Persistent store of validation results shared between runs."""
+
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+LOG = logging.getLogger(__name__)
+
+# File name of the store inside the configured cache directory
+RESULT_STORE_FILE = "results.sqlite3"
+
+
+class ResultStore:
+    """SQLite-backed store of definitive check results.
+
+    Results are keyed by validator name and a digest of the secret, so the store
+    never holds the secrets themselves. Entries older than ttl seconds are ignored,
+    so revoked secrets are eventually checked again.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], ttl: float):
+        """Open or create the store.
+
+        Args:
+            cache_dir: Directory holding the store file
+            ttl: Seconds a stored result stays valid
+        """
+        self.ttl = ttl
+        self.path = Path(cache_dir) / RESULT_STORE_FILE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Checks run on worker threads, so one connection is shared under a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "validator TEXT NOT NULL, digest BLOB NOT NULL, valid INTEGER NOT NULL, "
+                "checked_at REAL NOT NULL, PRIMARY KEY (validator, digest))"
+            )
+        LOG.debug("Opened result store %s", self.path)
+
+    def get(self, validator: str, digest: bytes) -> Optional[bool]:
+        """Get a stored result, or None if there is no fresh one."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT valid, checked_at FROM results WHERE validator = ? AND digest = ?",
+                (validator, digest),
+            ).fetchone()
+
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return bool(row[0])
+
+    def put(self, validator: str, digest: bytes, valid: bool) -> None:
+        """Store a definitive result."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (validator, digest, int(valid), time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            self._conn.close()
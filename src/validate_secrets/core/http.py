@@ -0,0 +1,49 @@
+"""Shared HTTP helpers for validators."""
+
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_SIZE = 32
+
+# Failed connections and throttled or gateway errors are retried, but not read timeouts,
+# since the server may already have handled the request. When retries run out the last
+# response is returned rather than raised, so callers still see its status.
+DEFAULT_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    raise_on_status=False,
+)
+
+
+def create_session(
+    headers: Optional[Dict[str, str]] = None,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    retry: Retry = DEFAULT_RETRY,
+) -> requests.Session:
+    """Create a requests session with a pooled, retrying HTTPS adapter.
+
+    Args:
+        headers: Default headers to set on the session
+        pool_size: Maximum number of keep-alive connections per host
+        retry: Retry policy of the adapter
+
+    Returns:
+        A configured requests.Session
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    return session
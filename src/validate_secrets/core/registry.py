@@ -1,106 +1,186 @@
 """Plugin registry and auto-discovery system."""
 
+import sys
+import functools
 import importlib
-import inspect
 import pkgutil
 import logging
 from pathlib import Path
-from typing import Dict, Type, List, Any
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Type, List, Any, Iterable, Optional, Tuple, Mapping
 
 from .exceptions import ValidatorError
+from ._registry_table import TABLE
 
 LOG = logging.getLogger(__name__)
 
+# TODO: Make this configurable if needed
+VALIDATORS_PATH = Path(__file__).parent.parent / "validators"
+
+# Package that VALIDATORS_PATH is imported as, resolved once from this module's own package
+VALIDATORS_PACKAGE = f"{__package__.rpartition('.')[0]}.validators"
+
+
+def discover_validators(skip_modules: Iterable[str] = ()) -> Dict[str, Tuple[str, str]]:
+    """Scan the validators directory for Checker subclasses.
+
+    Every module not listed in skip_modules is imported to find its validator.
+
+    Args:
+        skip_modules: Fully qualified module names that should not be imported
+
+    Returns:
+        Mapping of validator name to (module name, class name)
+    """
+    # Import Checker here to avoid import conflicts
+    from .base import Checker
+
+    found: Dict[str, Tuple[str, str]] = {}
+    skip_modules = set(skip_modules)
+
+    if not VALIDATORS_PATH.exists():
+        LOG.warning("Validators directory not found: %s", VALIDATORS_PATH)
+        return found
+
+    LOG.debug("Scanning for validators in: %s", VALIDATORS_PATH)
+
+    # Scan for validator modules
+    for module_info in pkgutil.iter_modules([str(VALIDATORS_PATH)]):
+        if module_info.name.startswith("_"):
+            continue
+
+        module_name = f"{VALIDATORS_PACKAGE}.{module_info.name}"
+        if module_name in skip_modules:
+            continue
+
+        try:
+            module = importlib.import_module(module_name)
+
+            # Find Checker subclasses in the module
+            found_validator = False
+            # Cheapest predicates first; most module globals are not classes
+            for obj in module.__dict__.values():
+                if (
+                    isinstance(obj, type)
+                    and obj.__module__ == module.__name__
+                    and obj is not Checker
+                    and issubclass(obj, Checker)
+                ):
+                    # Use the validator's name attribute or fall back to module name
+                    validator_name = getattr(obj, "name", None) or module_info.name
+
+                    if validator_name in found:
+                        LOG.warning(
+                            "Duplicate validator name '%s' found in %s",
+                            validator_name,
+                            module_info.name,
+                        )
+                        continue
+
+                    found[validator_name] = (module_name, obj.__name__)
+                    LOG.debug("Discovered validator: %s -> %s", validator_name, obj.__name__)
+                    found_validator = True
+                    break  # Only one validator per module
+
+            if not found_validator:
+                LOG.warning("No Checker subclass found in module: %s", module_info.name)
+
+        except ImportError as e:
+            LOG.error("Failed to import validator module %s: %s", module_info.name, e)
+            continue
+        except Exception as e:
+            LOG.error("Failed to load validator module %s: %s", module_info.name, e)
+            continue
+
+    return found
+
 
 class ValidatorRegistry:
-    """Registry for dynamically loaded validators."""
+    """Registry for dynamically loaded validators.
+
+    Built-in validators come from the generated lookup table in _registry_table and
+    are only imported when first requested. Drop-in modules that are not in the
+    table are still discovered by scanning the validators directory.
+    """
 
     def __init__(self):
+        # None until built, so a registry with no validators is not rescanned every call
+        self._table: Optional[Dict[str, Tuple[str, str]]] = None
         self._validators: Dict[str, Type[Any]] = {}
+        # Read-only view handed to callers so they cannot alter the registry
+        self._validators_view: Mapping[str, Type[Any]] = MappingProxyType(self._validators)
         self._loaded = False
 
-    def load_validators(self) -> Dict[str, Type]:
-        """Dynamically load all validators from the validators directory."""
-        if self._loaded:
-            return self._validators
-
-        # Import Checker here to avoid import conflicts
-        from .base import Checker
-
-        self._validators.clear()
+    def _load_table(self) -> Dict[str, Tuple[str, str]]:
+        """Build the name -> (module, class) table without importing known validators."""
+        if self._table is not None:
+            return self._table
+
+        # The table holds module names relative to the validators package, so it
+        # matches discovery whatever the package is installed as
+        table = {
+            name: (f"{VALIDATORS_PACKAGE}.{module}", class_name)
+            for name, (module, class_name) in TABLE.items()
+        }
+        for name, location in discover_validators({module for module, _ in table.values()}).items():
+            if name in table:
+                LOG.warning("Duplicate validator name '%s' found in %s", name, location[0])
+                continue
+            # Names are looked up on every get_validator call, so keep one shared copy
+            table[sys.intern(name)] = location
 
-        # Get the validators directory path
-        # TODO: Make this configurable if needed
-        validators_path = Path(__file__).parent.parent / "validators"
+        self._table = table
+        return self._table
 
-        if not validators_path.exists():
-            LOG.warning(f"Validators directory not found: {validators_path}")
-            return self._validators
+    def _resolve(self, name: str) -> Type[Any]:
+        """Import the validator class registered under name."""
+        if name not in self._validators:
+            module_name, class_name = self._table[name]
+            module = importlib.import_module(module_name)
+            self._validators[name] = getattr(module, class_name)
+            LOG.debug("Registered validator: %s -> %s", name, class_name)
+        return self._validators[name]
 
-        LOG.debug(f"Scanning for validators in: {validators_path}")
+    def load_validators(self) -> Mapping[str, Type]:
+        """Load all validators.
 
-        # Scan for validator modules
-        for module_info in pkgutil.iter_modules([str(validators_path)]):
-            if module_info.name.startswith("_"):
-                continue
+        Returns:
+            Read-only mapping of validator name to class
+        """
+        if self._loaded:
+            return self._validators_view
 
+        for name in self._load_table():
             try:
-                # Import the module - use only the correct package namespace
-                module_name = f"validate_secrets.validators.{module_info.name}"
-                module = importlib.import_module(module_name)
-
-                # Find Checker subclasses in the module
-                found_validator = False
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if (
-                        issubclass(obj, Checker)
-                        and obj.__name__ != "Checker"
-                        and obj.__module__ == module.__name__
-                    ):
-                        # Use the validator's name attribute or fall back to module name
-                        validator_name = getattr(obj, "name", None) or module_info.name
-
-                        if validator_name in self._validators:
-                            LOG.warning(
-                                f"Duplicate validator name '{validator_name}' found in {module_info.name}"
-                            )
-                            continue
-
-                        self._validators[validator_name] = obj
-                        LOG.debug(f"Registered validator: {validator_name} -> {obj.__name__}")
-                        found_validator = True
-                        break  # Only one validator per module
-
-                if not found_validator:
-                    LOG.warning(f"No Checker subclass found in module: {module_info.name}")
-
-            except ImportError as e:
-                LOG.error(f"Failed to import validator module {module_info.name}: {e}")
-                continue
+                self._resolve(name)
             except Exception as e:
-                LOG.error(f"Failed to load validator module {module_info.name}: {e}")
+                LOG.error("Failed to load validator %s: %s", name, e)
                 continue
 
+        # Keep table order regardless of which validators were requested first
+        loaded = {name: self._validators[name] for name in self._table if name in self._validators}
+        self._validators.clear()
+        self._validators.update(loaded)
         self._loaded = True
-        LOG.info(f"Loaded {len(self._validators)} validators: {list(self._validators.keys())}")
-        return self._validators
+        LOG.info("Loaded %s validators: %s", len(self._validators), list(self._validators.keys()))
+        return self._validators_view
 
     def get_validator(self, name: str) -> Type[Any]:
-        """Get a validator by name."""
-        if not self._loaded:
-            self.load_validators()
+        """Get a validator by name, importing only that validator's module."""
+        table = self._load_table()
 
-        if name not in self._validators:
-            available = list(self._validators.keys())
+        if name not in table:
+            available = list(table.keys())
             raise ValidatorError(f"Unknown validator '{name}'. Available: {available}")
 
-        return self._validators[name]
+        try:
+            return self._resolve(name)
+        except Exception as e:
+            raise ValidatorError(f"Failed to load validator '{name}': {e}")
 
     def list_validators(self) -> List[str]:
         """List all available validator names."""
-        if not self._loaded:
-            self.load_validators()
-        return list(self._validators.keys())
+        return list(self._load_table().keys())
 
     def get_validator_info(self) -> Dict[str, Dict]:
         """Get detailed information about all validators."""
@@ -109,10 +189,9 @@ class ValidatorRegistry:
 
         info = {}
         for name, validator_class in self._validators.items():
-            # Create a temporary instance to get metadata
+            # Metadata is read from the class, so validators are never instantiated here
             try:
-                temp_instance = validator_class()
-                info[name] = temp_instance.get_metadata()
+                info[name] = validator_class.get_metadata()
             except Exception as e:
                 info[name] = {"name": name, "class": validator_class.__name__, "error": str(e)}
         return info
@@ -122,13 +201,17 @@ class ValidatorRegistry:
 _registry = ValidatorRegistry()
 
 
-def get_validators() -> Dict[str, Type[Any]]:
-    """Get all loaded validators."""
+def get_validators() -> Mapping[str, Type[Any]]:
+    """Get all loaded validators as a read-only mapping."""
     return _registry.load_validators()
 
 
+@functools.lru_cache(maxsize=256)
 def get_validator(name: str) -> Type[Any]:
-    """Get a specific validator by name."""
+    """Get a specific validator by name.
+
+    Cached, since the CLI looks up a validator for every secret type it validates.
+    """
     return _registry.get_validator(name)
 
 
@@ -137,6 +220,19 @@ def list_validators() -> List[str]:
     return _registry.list_validators()
 
 
+@functools.lru_cache(maxsize=1)
+def validator_names() -> FrozenSet[str]:
+    """Names of all available validators, for checking a secret type without a lookup.
+
+    Unknown types can then be skipped without raising and catching a ValidatorError.
+    """
+    return frozenset(_registry.list_validators())
+
+
+@functools.lru_cache(maxsize=1)
 def get_validator_info() -> Dict[str, Dict]:
-    """Get detailed information about all validators."""
+    """Get detailed information about all validators.
+
+    Computed once per process, since it imports every validator module.
+    """
     return _registry.get_validator_info()
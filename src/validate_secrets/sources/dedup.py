@@ -0,0 +1,49 @@
+"""Data source wrapper that drops repeated secrets."""
+
+from typing import Iterator, Dict, Any, Tuple, Optional
+
+from .base import DataSource
+
+
+class DedupSource(DataSource):
+    """Data source that yields each distinct secret of a given type only once.
+
+    The same leaked secret is often reported in many files or alerts. Only the
+    first record is yielded; the metadata of later records is appended to its
+    metadata["duplicates"] list, which is complete once iteration has finished.
+    Records from GitHub alerts also collect every alert number sharing the secret
+    in metadata["alert_numbers"].
+    """
+
+    def __init__(self, source: DataSource):
+        """Initialize the wrapper.
+
+        Args:
+            source: The data source to deduplicate
+        """
+        self.source = source
+
+    def get_secrets(self) -> Iterator[Dict[str, Any]]:
+        """Get distinct secrets from the wrapped source."""
+        first_seen: Dict[Tuple[Optional[str], str], Dict[str, Any]] = {}
+
+        for secret_data in self.source.get_secrets():
+            key = (secret_data.get("type"), secret_data["secret"])
+
+            metadata = secret_data.get("metadata", {})
+            first = first_seen.get(key)
+            if first is not None:
+                first_metadata = first.setdefault("metadata", {})
+                first_metadata.setdefault("duplicates", []).append(metadata)
+                if "alert_numbers" in first_metadata:
+                    first_metadata["alert_numbers"].append(metadata.get("alert_number"))
+                continue
+
+            if "alert_number" in metadata:
+                metadata["alert_numbers"] = [metadata["alert_number"]]
+            first_seen[key] = secret_data
+            yield secret_data
+
+    def get_name(self) -> str:
+        """Get the name of this source."""
+        return self.source.get_name()
@@ -1,13 +1,109 @@
 """File-based data source."""
 
+import re
 import csv
 import json
 from pathlib import Path
-from typing import Iterator, Dict, Any
+from typing import Iterator, Iterable, Dict, Any, List, Optional, TextIO
 
 from .base import DataSource
 from ..core.exceptions import SourceError
 
+# Characters read from a JSON file at a time when streaming an array
+JSON_READ_SIZE = 1 << 16
+
+JSON_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+# Characters that may follow a complete value inside a JSON array
+JSON_VALUE_END = frozenset(",] \t\n\r")
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _iter_json_array(f: TextIO) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array one at a time.
+
+    Only the element being decoded is held in memory, rather than the whole document.
+
+    Args:
+        f: Text file positioned at the start of the document
+
+    Raises:
+        ValueError: If the document is not a well-formed JSON array
+    """
+    buf = ""
+    pos = 0
+    eof = False
+    expect = "["
+
+    while True:
+        pos = JSON_WHITESPACE_RE.match(buf, pos).end()
+        if pos == len(buf) and eof:
+            raise ValueError("Unexpected end of JSON array")
+
+        if pos < len(buf):
+            char = buf[pos]
+
+            if expect == "[":
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                pos += 1
+                expect = "first"
+                continue
+
+            if expect == "separator" or (expect == "first" and char == "]"):
+                if char == "]":
+                    return
+                if char != ",":
+                    raise ValueError(f"Unexpected {char!r} in JSON array")
+                pos += 1
+                expect = "value"
+                continue
+
+            try:
+                item, end = _JSON_DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = len(buf)
+
+            # A value not yet followed by a separator may be truncated (e.g. "2." of "2.5"),
+            # so read more and decode it again
+            if eof or (end < len(buf) and buf[end] in JSON_VALUE_END):
+                yield item
+                pos = end
+                expect = "separator"
+                continue
+
+        chunk = f.read(JSON_READ_SIZE)
+        eof = not chunk
+        buf, pos = buf[pos:] + chunk, 0
+
+
+def _column_indexes(header: List[str], *names: str) -> List[int]:
+    """Indexes of the named CSV columns, in the order the names are given."""
+    return [header.index(name) for name in names if name in header]
+
+
+def _row_dict(header: List[str], row: List[str]) -> Dict[Optional[str], Any]:
+    """Map a CSV row to its header the way csv.DictReader does.
+
+    Columns missing from a short row are None, and the extra fields of a long
+    row are listed under the None key.
+    """
+    record: Dict[Optional[str], Any] = dict(zip(header, row))
+    if len(row) > len(header):
+        record[None] = row[len(header) :]
+    else:
+        for name in header[len(row) :]:
+            record[name] = None
+    return record
+
+
+def _first_value(row: List[str], columns: List[int]) -> Optional[str]:
+    """First non-empty value among the given columns of a CSV row."""
+    return next((row[i] for i in columns if i < len(row) and row[i]), None)
+
 
 class FileSource(DataSource):
     """Data source that reads secrets from files."""
@@ -57,54 +153,61 @@ class FileSource(DataSource):
                 }
 
     def _read_csv(self) -> Iterator[Dict[str, Any]]:
-        """Read secrets from a CSV file."""
+        """Read secrets from a CSV file.
+
+        Rows are read as lists and the secret and type columns are located once from
+        the header, instead of building a dict per row just to look them up.
+        """
         with open(self.file_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+
+            header = next(reader, None)
+            if header is None:
+                return
+
+            secret_columns = _column_indexes(header, "secret", "Secret")
+            type_columns = _column_indexes(header, "type", "Type")
 
-            for row_num, row in enumerate(reader, 2):  # skip header row
-                secret = row.get("secret") or row.get("Secret")
+            # Blank lines are skipped without counting, as csv.DictReader does
+            for row_num, row in enumerate(filter(None, reader), 2):  # skip header row
+                secret = _first_value(row, secret_columns)
                 if not secret:
                     # Try to find the first non-empty column
-                    secret = next((v for v in row.values() if v), None)
+                    secret = next((v for v in row if v), None)
 
                 if not secret:
                     continue
 
-                secret_type = row.get("type") or row.get("Type") or self.secret_type
+                secret_type = _first_value(row, type_columns) or self.secret_type
 
                 yield {
                     "secret": secret.strip(),
                     "type": secret_type,
-                    "metadata": {"source": str(self.file_path), "row": row_num, "csv_data": row},
+                    "metadata": {
+                        "source": str(self.file_path),
+                        "row": row_num,
+                        "csv_data": _row_dict(header, row),
+                    },
                 }
 
     def _read_json(self) -> Iterator[Dict[str, Any]]:
-        """Read secrets from a JSON file."""
+        """Read secrets from a JSON file.
+
+        Array documents are decoded one element at a time, so large exports are
+        never loaded into memory whole.
+        """
         with open(self.file_path, "r", encoding="utf-8") as f:
+            head = f.read(JSON_READ_SIZE).lstrip()
+            f.seek(0)
+
+            if head.startswith("["):
+                # List of secrets or secret objects
+                yield from self._json_list_secrets(_iter_json_array(f))
+                return
+
             data = json.load(f)
 
-        if isinstance(data, list):
-            # List of secrets or secret objects
-            for i, item in enumerate(data):
-                if isinstance(item, str):
-                    yield {
-                        "secret": item,
-                        "type": self.secret_type,
-                        "metadata": {"source": str(self.file_path), "index": i},
-                    }
-                elif isinstance(item, dict):
-                    secret = item.get("secret") or item.get("value")
-                    if secret:
-                        yield {
-                            "secret": secret,
-                            "type": item.get("type") or self.secret_type,
-                            "metadata": {
-                                "source": str(self.file_path),
-                                "index": i,
-                                "json_data": item,
-                            },
-                        }
-        elif isinstance(data, dict):
+        if isinstance(data, dict):
             # Single object with secrets
             if "secrets" in data:
                 for i, secret in enumerate(data["secrets"]):
@@ -115,6 +218,28 @@ class FileSource(DataSource):
                             "metadata": {"source": str(self.file_path), "index": i},
                         }
 
+    def _json_list_secrets(self, items: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+        """Turn the elements of a JSON array into secrets."""
+        for i, item in enumerate(items):
+            if isinstance(item, str):
+                yield {
+                    "secret": item,
+                    "type": self.secret_type,
+                    "metadata": {"source": str(self.file_path), "index": i},
+                }
+            elif isinstance(item, dict):
+                secret = item.get("secret") or item.get("value")
+                if secret:
+                    yield {
+                        "secret": secret,
+                        "type": item.get("type") or self.secret_type,
+                        "metadata": {
+                            "source": str(self.file_path),
+                            "index": i,
+                            "json_data": item,
+                        },
+                    }
+
     def get_name(self) -> str:
         """Get the name of this source."""
         return f"File: {self.file_path.name}"
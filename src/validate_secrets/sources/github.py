@@ -1,15 +1,70 @@
 """GitHub data source for secret scanning alerts."""
 
+import re
+import time
+import hashlib
+import threading
 import requests
 import logging
-from typing import Iterator, Dict, Any, Optional, List
-from urllib.parse import urljoin
+from collections import deque
+from itertools import islice
+from typing import Iterator, Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qs, urlencode
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 from .base import DataSource
 from ..core.exceptions import SourceError
+from ..core.http import create_session
 
 LOG = logging.getLogger(__name__)
 
+# Matches each (target, relation) entry in a Link header, e.g.
+# <https://api.github.com/...&page=2>; rel="next", <https://api.github.com/...>; rel="last"
+LINK_RE = re.compile(r"""<([^>]*)>[^,<]*;\s*rel=["']?([\w-]+)["']?""")
+
+# Pages of alerts fetched at once when the total number of pages is known
+PAGE_FETCH_WORKERS = 8
+
+# Retries of a rate-limited or failed request, and the longest backoff between them
+MAX_RETRIES = 5
+MAX_BACKOFF = 60
+
+# _get handles rate limits and server errors itself, so the adapter only retries
+# connections that could not be established
+CONNECTION_RETRY = Retry(
+    total=2, connect=2, read=0, status=0, backoff_factor=0.3, respect_retry_after_header=False
+)
+
+# Sessions shared by every source for the same API and token, keyed by (base_url, token digest)
+_SESSIONS: Dict[Tuple[str, bytes], requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _session_for(base_url: str, token: str) -> requests.Session:
+    """Get the pooled session for a GitHub API and token, creating it on first use.
+
+    Scanning several repositories in one run then reuses the same keep-alive
+    connections instead of opening new ones for every source.
+    """
+    key = (base_url, hashlib.sha256(token.encode("utf-8")).digest())
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = _SESSIONS[key] = create_session(
+                {
+                    "Authorization": f"token {token}",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                    # Alert pages are large JSON documents; ask for every codec urllib3 can
+                    # decode (gzip and deflate, plus br/zstd when those extras are installed)
+                    "Accept-Encoding": ACCEPT_ENCODING,
+                },
+                retry=CONNECTION_RETRY,
+            )
+        return session
+
 
 class GitHubSource(DataSource):
     """Data source that reads secrets from GitHub secret scanning alerts."""
@@ -23,6 +78,7 @@ class GitHubSource(DataSource):
         state: str = "open",
         secret_type: str = None,
         validity: str = "unknown",
+        per_page: int = 100,
     ):
         """Initialize GitHub source.
 
@@ -34,6 +90,7 @@ class GitHubSource(DataSource):
             state: Filter by alert state (open, resolved)
             secret_type: Filter by specific secret type
             validity: Filter by secret validity (valid, invalid, unknown)
+            per_page: Alerts requested per page (GitHub allows at most 100)
         """
         self.token = token
         self.org = org
@@ -42,6 +99,7 @@ class GitHubSource(DataSource):
         self.state = state
         self.secret_type = secret_type
         self.validity = validity
+        self.per_page = per_page
 
         if not (org or repo):
             raise SourceError("Either organization or repository must be specified")
@@ -49,14 +107,11 @@ class GitHubSource(DataSource):
         if org and repo:
             raise SourceError("Cannot specify both organization and repository")
 
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"token {token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28",
-            }
-        )
+        if not 1 <= per_page <= 100:
+            raise SourceError("per_page must be between 1 and 100")
+
+        # Pooled keep-alive connections are reused across every page of alerts
+        self.session = _session_for(self.base_url, token)
 
     def get_secrets(self) -> Iterator[Dict[str, Any]]:
         """Get secrets from GitHub secret scanning alerts."""
@@ -79,53 +134,166 @@ class GitHubSource(DataSource):
         yield from self._fetch_alerts(url)
 
     def _fetch_alerts(self, url: str) -> Iterator[Dict[str, Any]]:
-        """Fetch alerts from GitHub API with pagination."""
-        params = {"state": self.state, "validity": self.validity, "per_page": 100}
+        """Fetch alerts from GitHub API with pagination.
+
+        When the first page links to a numbered last page, the remaining pages are
+        fetched concurrently; otherwise the next links are followed one at a time.
+        """
+        params = {"state": self.state, "validity": self.validity, "per_page": self.per_page}
 
         if self.secret_type:
             params["secret_type"] = self.secret_type
 
+        response = self._get_page(url, params)
+        yield from self._page_alerts(response)
+
+        page_urls = self._get_remaining_page_urls(response)
+        if page_urls:
+            yield from self._fetch_pages(page_urls)
+            return
+
+        # Handle pagination
+        url = self._get_next_page_url(response)
         while url:
-            LOG.debug(f"Fetching alerts from: {url}")
+            # Params are already part of the next page URL
+            response = self._get_page(url)
+            yield from self._page_alerts(response)
+            url = self._get_next_page_url(response)
+
+    def _fetch_pages(self, page_urls: List[str]) -> Iterator[Dict[str, Any]]:
+        """Fetch numbered pages concurrently, yielding their alerts in page order.
+
+        At most PAGE_FETCH_WORKERS pages are in flight. When a page fails, pages that
+        have not started are cancelled and the error is raised without waiting for
+        the others, which may be sleeping through rate limit retries.
+        """
+        executor = ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS)
+        urls = iter(page_urls)
+        pending = deque(
+            executor.submit(self._get_page, url) for url in islice(urls, PAGE_FETCH_WORKERS)
+        )
+        try:
+            while pending:
+                response = pending.popleft().result()
+                for url in islice(urls, 1):
+                    pending.append(executor.submit(self._get_page, url))
+                yield from self._page_alerts(response)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+    def _get_page(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """Fetch one page of alerts, raising SourceError on API errors."""
+        LOG.debug("Fetching alerts from: %s", url)
+        response = self._get(url, params)
+
+        if response.status_code == 401:
+            raise SourceError("GitHub authentication failed. Check your token.")
+        elif response.status_code == 403:
+            raise SourceError("GitHub access forbidden. Check your token permissions.")
+        elif response.status_code == 404:
+            raise SourceError(f"GitHub resource not found. Check organization/repository name.")
+        elif response.status_code != 200:
+            raise SourceError(f"GitHub API error: {response.status_code} - {response.text}")
+
+        return response
+
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """GET a GitHub API URL, waiting out rate limits and retrying server errors.
+
+        429s, 403s that are rate limits (no rate limit remaining, or a Retry-After from
+        a secondary rate limit) and 5xx responses are retried up to MAX_RETRIES times.
+        When a successful response uses up the rate limit, this waits for the limit to
+        reset so the next request does not fail.
+        """
+        for attempt in range(MAX_RETRIES + 1):
             response = self.session.get(url, params=params)
+            remaining = self._header_int(response, "X-RateLimit-Remaining")
+            retry = (
+                response.status_code == 429
+                or (
+                    response.status_code == 403
+                    and (remaining == 0 or "Retry-After" in response.headers)
+                )
+                or response.status_code >= 500
+            )
+            if not retry or attempt == MAX_RETRIES:
+                break
 
-            if response.status_code == 401:
-                raise SourceError("GitHub authentication failed. Check your token.")
-            elif response.status_code == 403:
-                raise SourceError("GitHub access forbidden. Check your token permissions.")
-            elif response.status_code == 404:
-                raise SourceError(f"GitHub resource not found. Check organization/repository name.")
-            elif response.status_code != 200:
-                raise SourceError(f"GitHub API error: {response.status_code} - {response.text}")
-
-            alerts = response.json()
-
-            for alert in alerts:
-                # Extract the secret value if available
-                secret_value = self._extract_secret_value(alert)
-                if secret_value:
-                    github_secret_type = alert.get("secret_type")
-
-                    yield {
-                        "secret": secret_value,
-                        "type": github_secret_type,  # GitHub secret type - we use it directly as validator name
-                        "metadata": {
-                            "source": "GitHub Secret Scanning",
-                            "alert_number": alert.get("number"),
-                            "repository": alert.get("repository", {}).get("full_name"),
-                            "state": alert.get("state"),
-                            "created_at": alert.get("created_at"),
-                            "updated_at": alert.get("updated_at"),
-                            "url": alert.get("html_url"),
-                            "locations": alert.get("locations", []),
-                            "secret_type_display_name": alert.get("secret_type_display_name"),
-                            "validity": alert.get("validity"),
-                        },
-                    }
-
-            # Handle pagination
-            url = self._get_next_page_url(response)
-            params = {}  # Clear params for subsequent requests (they're in the URL)
+            delay = self._retry_delay(response, attempt)
+            LOG.warning(
+                "GitHub returned %s, retrying in %.0f seconds (attempt %d of %d)",
+                response.status_code,
+                delay,
+                attempt + 1,
+                MAX_RETRIES,
+            )
+            time.sleep(delay)
+
+        if response.status_code == 200 and remaining is not None and remaining <= 1:
+            delay = self._reset_delay(response)
+            if delay:
+                LOG.warning("GitHub rate limit used up, waiting %.0f seconds for reset", delay)
+                time.sleep(delay)
+
+        return response
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited or failed request.
+
+        Never less than the exponential backoff, so a missing reset header or a
+        Retry-After of 0 does not turn into an immediate retry.
+        """
+        backoff = min(MAX_BACKOFF, 2**attempt)
+        retry_after = self._header_int(response, "Retry-After")
+        if retry_after is not None:
+            return max(backoff, retry_after)
+        if self._header_int(response, "X-RateLimit-Remaining") == 0:
+            return max(backoff, self._reset_delay(response))
+        return backoff
+
+    def _reset_delay(self, response: requests.Response) -> float:
+        """Seconds until the rate limit in the response headers resets."""
+        reset = self._header_int(response, "X-RateLimit-Reset")
+        if reset is None:
+            return 0
+        return max(0, reset - time.time())
+
+    @staticmethod
+    def _header_int(response: requests.Response, name: str) -> Optional[int]:
+        """Read a non-negative integer header, or None if it is missing or malformed."""
+        value = response.headers.get(name)
+        if isinstance(value, str) and value.isdigit():
+            return int(value)
+        return None
+
+    def _page_alerts(self, response: requests.Response) -> Iterator[Dict[str, Any]]:
+        """Turn one page of alerts into secrets."""
+        alerts = response.json()
+
+        for alert in alerts:
+            # Extract the secret value if available
+            secret_value = self._extract_secret_value(alert)
+            if secret_value:
+                github_secret_type = alert.get("secret_type")
+
+                yield {
+                    "secret": secret_value,
+                    "type": github_secret_type,  # GitHub secret type - we use it directly as validator name
+                    "metadata": {
+                        "source": "GitHub Secret Scanning",
+                        "alert_number": alert.get("number"),
+                        "repository": alert.get("repository", {}).get("full_name"),
+                        "state": alert.get("state"),
+                        "created_at": alert.get("created_at"),
+                        "updated_at": alert.get("updated_at"),
+                        "url": alert.get("html_url"),
+                        "locations": alert.get("locations", []),
+                        "secret_type_display_name": alert.get("secret_type_display_name"),
+                        "validity": alert.get("validity"),
+                    },
+                }
 
     def _extract_secret_value(self, alert: Dict[str, Any]) -> Optional[str]:
         """Extract the secret value from a GitHub alert.
@@ -135,32 +303,33 @@ class GitHubSource(DataSource):
         """
         return alert.get("secret")
 
+    def _get_links(self, response: requests.Response) -> Dict[str, str]:
+        """Map each relation in the Link header (next, last, ...) to its URL."""
+        return {rel: url for url, rel in LINK_RE.findall(response.headers.get("Link", ""))}
+
     def _get_next_page_url(self, response: requests.Response) -> Optional[str]:
         """Extract next page URL from GitHub API response headers."""
-        link_header = response.headers.get("Link", "")
-
-        if not link_header:
-            return None
-
-        # Parse Link header to find 'next' relation
-        links = {}
-        for link in link_header.split(","):
-            if ";" not in link:
-                continue
-            url_part, rel_part = link.split(";", 1)
-            url = url_part.strip().strip("<>")
-
-            rel_match = None
-            for part in rel_part.split(";"):
-                part = part.strip()
-                if part.startswith("rel="):
-                    rel_match = part.split("=", 1)[1].strip().strip("\"'")
-                    break
-
-            if rel_match:
-                links[rel_match] = url
-
-        return links.get("next")
+        return self._get_links(response).get("next")
+
+    def _get_remaining_page_urls(self, response: requests.Response) -> List[str]:
+        """URLs of pages 2..last when the first page links to a numbered last page.
+
+        Cursor-based pagination has no last link, in which case this is empty.
+        """
+        last_url = self._get_links(response).get("last")
+        if not last_url:
+            return []
+
+        parts = urlsplit(last_url)
+        query = parse_qs(parts.query)
+        if not query.get("page", [""])[0].isdigit():
+            return []
+
+        urls = []
+        for page in range(2, int(query["page"][0]) + 1):
+            query["page"] = [str(page)]
+            urls.append(urlunsplit(parts._replace(query=urlencode(query, doseq=True))))
+        return urls
 
     def get_name(self) -> str:
         """Get the name of this source."""
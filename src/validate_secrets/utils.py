@@ -1,19 +1,58 @@
 """Utility functions for validate-secrets CLI."""
 
+import os
 import sys
 import csv
 import json
+import tempfile
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, Optional, TextIO, Tuple
 
 from rich.console import Console
 from rich.table import Table
 
 console = Console()
 
+# Large write buffer so result files are flushed in few syscalls
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def _open_output(output_file: str, newline: Optional[str] = None) -> Iterator[TextIO]:
+    """Open the output file, or stdout when none is given.
+
+    Results are written while validation is still running, so they go to a
+    temporary file in the same directory that only replaces output_file once
+    everything was written. An interrupted or failed run leaves any previous
+    results file untouched.
+    """
+    if not output_file:
+        yield sys.stdout
+        return
+
+    path = Path(output_file)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with open(fd, "w", newline=newline, buffering=OUTPUT_BUFFER_SIZE) as output:
+            yield output
+        os.replace(tmp_name, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+def output_results(results: Iterable[Dict[str, Any]], output_file: str, format_type: str):
+    """Output results in the specified format.
+
+    Results may be a lazy iterable; CSV and JSON rows are written as they arrive,
+    and the output file is only replaced once all of them were written.
+    """
+    if not output_file:
+        # Progress bars and warnings share stdout, so finish validating before printing
+        results = list(results)
 
-def output_results(results: List[Dict[str, Any]], output_file: str, format_type: str):
-    """Output results in the specified format."""
     if format_type == "table":
         output_table(results)
     elif format_type == "json":
@@ -22,7 +61,7 @@ def output_results(results: List[Dict[str, Any]], output_file: str, format_type:
         output_csv(results, output_file)
 
 
-def output_table(results: List[Dict[str, Any]]):
+def output_table(results: Iterable[Dict[str, Any]]):
     """Output results as a table."""
     table = Table(title="Validation Results")
     table.add_column("Secret", style="cyan", no_wrap=True)
@@ -47,37 +86,39 @@ def output_table(results: List[Dict[str, Any]]):
     console.print(table)
 
 
-def output_csv(results: List[Dict[str, Any]], output_file: str):
-    """Output results as CSV."""
-    output = sys.stdout if not output_file else open(output_file, "w", newline="")
+def _csv_rows(results: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    """Flatten results into CSV rows."""
+    for result in results:
+        metadata = result.get("metadata", {})
+        source = metadata.get("source", "Unknown")
+        metadata_str = json.dumps(metadata) if metadata else ""
 
-    try:
+        yield (result["secret"], result["type"], result["status"], source, metadata_str)
+
+
+def output_csv(results: Iterable[Dict[str, Any]], output_file: str):
+    """Output results as CSV."""
+    with _open_output(output_file, newline="") as output:
         writer = csv.writer(output)
         writer.writerow(["secret", "type", "status", "source", "metadata"])
 
+        writer.writerows(_csv_rows(results))
+
+
+def output_json(results: Iterable[Dict[str, Any]], output_file: str):
+    """Output results as JSON.
+
+    The document is written incrementally so results never have to be held in
+    memory at once; total_secrets therefore follows the results array. Each
+    result is written compactly on its own line, since json only uses its C
+    encoder when no indent is requested.
+    """
+    with _open_output(output_file) as output:
+        output.write('{\n  "timestamp": %s,\n  "results": [' % json.dumps(str(Path().cwd())))
+
+        total = 0
         for result in results:
-            metadata = result.get("metadata", {})
-            source = metadata.get("source", "Unknown")
-            metadata_str = json.dumps(metadata) if metadata else ""
-
-            writer.writerow(
-                [result["secret"], result["type"], result["status"], source, metadata_str]
-            )
-    finally:
-        if output_file:
-            output.close()
-
-
-def output_json(results: List[Dict[str, Any]], output_file: str):
-    """Output results as JSON."""
-    output_data = {
-        "timestamp": str(Path().cwd()),
-        "total_secrets": len(results),
-        "results": results,
-    }
-
-    if output_file:
-        with open(output_file, "w") as f:
-            json.dump(output_data, f, indent=2)
-    else:
-        print(json.dumps(output_data, indent=2))
+            output.write(("," if total else "") + "\n    " + json.dumps(result))
+            total += 1
+
+        output.write('%s],\n  "total_secrets": %d\n}\n' % ("\n  " if total else "", total))
@@ -5,9 +5,11 @@
 import os
 import requests
 import logging
+from functools import cached_property
 from typing import Optional
 
-from ..core.base import Checker
+from ..core.base import Checker, cached_check
+from ..core.http import create_session
 
 LOG = logging.getLogger(__name__)
 
@@ -26,8 +28,6 @@ class DatabricksTokenChecker(Checker):
         host_url: Optional[str] = None,
     ) -> None:
         super().__init__(notify, debug, timeout)
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
 
         # Handle host_url: strip trailing slash
         self.host_url = host_url.rstrip("/") if host_url else None
@@ -38,6 +38,24 @@ class DatabricksTokenChecker(Checker):
             if env_host:
                 self.host_url = env_host
 
+    @property
+    def cache_namespace(self) -> str:
+        """Results are only valid for the workspace host they were checked against."""
+        return f"{self.name}:{self.host_url}"
+
+    @cached_property
+    def session(self) -> requests.Session:
+        """HTTP session, created on first use so metadata lookups never open one."""
+        return create_session({"Content-Type": "application/json"})
+
+    @cached_property
+    def _request_template(self) -> requests.PreparedRequest:
+        """GET request to the token API, prepared once; each check copies it and adds its token."""
+        return self.session.prepare_request(
+            requests.Request("GET", f"{self.host_url}/api/2.0/token/list")
+        )
+
+    @cached_check
     def check(self, token: str) -> Optional[bool]:
         """Check if a Databricks token is still active."""
         token = token.strip()
@@ -52,13 +70,11 @@ class DatabricksTokenChecker(Checker):
             LOG.debug("Cannot notify Databricks tokens")
 
         try:
-            api_url = f"{self.host_url}/api/2.0/token/list"
-            request = self.session.prepare_request(
-                requests.Request("GET", api_url, headers={"Authorization": f"Bearer {token}"})
-            )
-            LOG.debug("Request URL: %s", api_url)
+            request = self._request_template.copy()
+            request.headers["Authorization"] = f"Bearer {token}"
+            LOG.debug("Request URL: %s", request.url)
             LOG.debug("Headers: %s", request.headers)
-            response = self.session.send(request, timeout=self.timeout)
+            response = self.session.send(request, timeout=self.http_timeout)
 
             LOG.debug("Response status: %s", response.status_code)
             LOG.debug("Response text: %s", response.text)
@@ -3,14 +3,18 @@
 """Validator for Google API Keys."""
 
 import re
-import requests
 import logging
+import requests
+from functools import cached_property
 from typing import Optional
 
-from ..core.base import Checker
+from ..core.base import Checker, cached_check
+from ..core.http import create_session
 
 LOG = logging.getLogger(__name__)
 
+GOOGLE_API_KEY_PREFIX = "AIza"
+GOOGLE_API_KEY_LENGTH = 39
 GOOGLE_API_KEY_RE = re.compile(r"^AIza[A-Za-z0-9-_]{35}$")
 GOOGLE_MAPS_URL = "https://maps.googleapis.com/maps/api/geocode/json?address=1600+Amphitheatre+Parkway,+Mountain+View,+CA&key="
 GOOGLE_API_DENIED_STATUS = "REQUEST_DENIED"
@@ -24,17 +28,27 @@ class GoogleApiKeyChecker(Checker):
     name = "google_api_key"  # Match GitHub secret type exactly
     description = "Validates Google API Keys"
 
-    def __init__(self, notify: bool = False, debug: bool = False, timeout: int = 30) -> None:
-        super().__init__(notify, debug, timeout)
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
+    @cached_property
+    def session(self) -> requests.Session:
+        """HTTP session, created on first use so metadata lookups never open one."""
+        return create_session({"Content-Type": "application/json"})
+
+    @cached_property
+    def _request_template(self) -> requests.PreparedRequest:
+        """GET request to the Maps API, prepared once; each check copies it and appends its key."""
+        return self.session.prepare_request(requests.Request("GET", GOOGLE_MAPS_URL))
 
+    @cached_check
     def check(self, key: str) -> Optional[bool]:
         """Check if a Google API Key is valid."""
         key = key.rstrip()
 
-        # check the format against the regex
-        if not GOOGLE_API_KEY_RE.match(key):
+        # check the format, with cheap length and prefix tests before the regex
+        if (
+            len(key) != GOOGLE_API_KEY_LENGTH
+            or not key.startswith(GOOGLE_API_KEY_PREFIX)
+            or not GOOGLE_API_KEY_RE.match(key)
+        ):
             LOG.error("Invalid format for Google API key")
             return None
 
@@ -44,7 +58,12 @@ class GoogleApiKeyChecker(Checker):
         try:
             # check the key against the Google Maps API
             # no need to URL encode the key, since we know it is already URL safe, having verified it with the regex
-            response = requests.get(GOOGLE_MAPS_URL + key, timeout=self.timeout)
+            request = self._request_template.copy()
+            request.url += key
+            # send() skips the proxy and CA bundle settings that session.get() reads from
+            # the environment, so they are merged in here
+            settings = self.session.merge_environment_settings(request.url, {}, None, None, None)
+            response = self.session.send(request, timeout=self.http_timeout, **settings)
 
             if response.status_code == 200:
                 data = response.json()
@@ -58,12 +77,12 @@ class GoogleApiKeyChecker(Checker):
                     else:
                         # some other error, we return an error
                         LOG.warning(
-                            f'Unexpected error message for key {key}: {data["error_message"]}'
+                            "Unexpected error message for key %s: %s", key, data["error_message"]
                         )
                         return None
                 return True
         except Exception as e:
-            LOG.error(f"Error for key {key}: {e}")
+            LOG.error("Error for key %s: %s", key, e)
             return None
 
         return None
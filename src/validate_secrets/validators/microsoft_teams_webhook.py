@@ -2,16 +2,52 @@
 
 """Validator for Microsoft Office incoming webhook URLs."""
 
+import re
 import json
-import requests
+import time
 import logging
-from typing import Optional
-from urllib3.util.url import parse_url
+import requests
+from collections import deque
+from functools import cached_property
+from typing import Optional, Iterable, Iterator
 
-from ..core.base import Checker
+from ..core.base import Checker, cached_check
+from ..core.http import create_session
 
 LOG = logging.getLogger(__name__)
 
+# Full structural check of a webhook URL: scheme, *.webhook.office.com host with an optional
+# port, and /webhookb2/ path. Used with fullmatch(), since "$" would also accept a trailing
+# newline. No nested quantifiers, so it runs in linear time.
+# The path is matched case-sensitively, so WEBHOOK_PATH is a cheap necessary condition.
+WEBHOOK_PATH = "/webhookb2/"
+OFFICE_WEBHOOK_RE = re.compile(
+    r"(?i:https?)://[^/?#\s]+\.(?i:webhook\.office\.com)(?::\d+)?/webhookb2/\S+"
+)
+
+# (connect, read) timeout for the bodyless pre-check request
+PRECHECK_TIMEOUT = (3, 5)
+
+# Card posted to the webhook when notifying its owners about the leak
+NOTIFY_MESSAGE = {
+    "@type": "MessageCard",
+    "@context": "http://schema.org/extensions",
+    "summary": "Webhook detected as leaked secret",
+    "themeColor": "FF0000",
+    "title": "Webhook detected as leaked secret",
+    "text": "This webhook has been detected as a secret leaked in GitHub.\n\nPlease delete the Incoming Webhook connector with the name shown at the top of this message and create a new one.\n\nYou should store the new webhook URL in a secure location.\n\nSecrets such as webhooks should not be stored in code or related locations in the repository such as an issue.",
+}
+
+# Request bodies, serialized once per process
+NOTIFY_BODY = json.dumps(NOTIFY_MESSAGE).encode("utf-8")
+# An empty card is rejected with "Summary or Text is required." by live webhooks
+PROBE_BODY = b"{}"
+
+
+def _is_webhook(url: str) -> bool:
+    """Check that a URL is an Office webhook, with the cheap path test before the regex."""
+    return WEBHOOK_PATH in url and OFFICE_WEBHOOK_RE.fullmatch(url) is not None
+
 
 class OfficeWebHookChecker(Checker):
     """Class to check if a Microsoft Teams Webhook is still valid."""
@@ -21,50 +57,31 @@ class OfficeWebHookChecker(Checker):
 
     def __init__(self, notify: bool = False, debug: bool = False, timeout: int = 30) -> None:
         super().__init__(notify, debug, timeout)
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
+        # The body only depends on notify, so it is serialized once at import
+        self._body = NOTIFY_BODY if notify else PROBE_BODY
+
+    @cached_property
+    def session(self) -> requests.Session:
+        """HTTP session, created on first use so metadata lookups never open one."""
+        return create_session({"Content-Type": "application/json"})
 
+    @cached_check
     def check(self, url: str) -> Optional[bool]:
         """Check if a webhook is still valid."""
+        # The pre-check and the POST share one time budget
+        deadline = time.monotonic() + self.timeout
 
         # confirm the webhook is an office webhook
-        parsed_url = parse_url(url)
-
-        url_to_check = parsed_url.url
-
-        if url_to_check != url:
-            LOG.warning(f"URL {url} is not normalized")
-
-        if parsed_url.host is None:
-            LOG.error(f"Error for link {url}: not a valid URL, no host")
+        if not _is_webhook(url):
+            LOG.error("Error for link %s: not a webhook.office.com link", url)
             return None
 
-        if parsed_url.path is None:
-            LOG.error(f"Error for link {url}: not a valid URL, no path")
-            return None
-
-        if not parsed_url.host.endswith(".webhook.office.com"):
-            LOG.error(f"Error for link {url}: not a webhook.office.com link")
-            return None
-
-        if not parsed_url.path.startswith("/webhookb2/"):
-            LOG.error(f"Error for link {url}: not a webhook.office.com link")
-            return None
-
-        data = {}
-
-        if self.notify:
-            data["@type"] = "MessageCard"
-            data["@context"] = "http://schema.org/extensions"
-            data["summary"] = "Webhook detected as leaked secret"
-            data["themeColor"] = "FF0000"
-            data["title"] = "Webhook detected as leaked secret"
-            data["text"] = (
-                "This webhook has been detected as a secret leaked in GitHub.\n\nPlease delete the Incoming Webhook connector with the name shown at the top of this message and create a new one.\n\nYou should store the new webhook URL in a secure location.\n\nSecrets such as webhooks should not be stored in code or related locations in the repository such as an issue."
-            )
+        # The regex only admits URLs without whitespace, so the raw string is requested as-is
+        if self._is_gone(url, deadline):
+            return False
 
         try:
-            response = requests.post(url_to_check, data=json.dumps(data), timeout=self.timeout)
+            response = self.session.post(url, data=self._body, timeout=self.timeout_until(deadline))
 
             if (
                 not self.notify
@@ -77,10 +94,57 @@ class OfficeWebHookChecker(Checker):
             elif response.status_code == 410:
                 return False
             else:
-                LOG.error(
-                    f"Error for link {url_to_check}: {response.text} ({response.status_code})"
-                )
+                LOG.error("Error for link %s: %s (%s)", url, response.text, response.status_code)
                 return None
         except Exception as e:
-            LOG.error(f"Error for webhook {url_to_check}: {e}")
+            LOG.error("Error for webhook %s: %s", url, e)
             return None
+
+    def _is_gone(self, url: str, deadline: float) -> bool:
+        """Cheap HEAD pre-check so webhooks that are already deleted skip the POST."""
+        connect_timeout, read_timeout = self.timeout_until(deadline)
+        timeout = (
+            min(PRECHECK_TIMEOUT[0], connect_timeout),
+            min(PRECHECK_TIMEOUT[1], read_timeout),
+        )
+
+        try:
+            response = self.session.head(url, timeout=timeout, allow_redirects=False)
+            return response.status_code == 410
+        except Exception as e:
+            # Inconclusive, let the POST decide
+            LOG.debug("Pre-check failed for webhook %s: %s", url, e)
+            return False
+
+    def check_many(self, urls: Iterable[str], max_workers: int = 32) -> Iterator[Optional[bool]]:
+        """Check many webhooks, screening each URL once before dispatch.
+
+        URLs that are not webhooks are answered here without being dispatched to
+        the thread pool. URLs are screened lazily as the pool asks for work, so the
+        input is never loaded all at once. Host names are left for the HTTP request
+        to resolve, since it may go through a proxy that resolves hosts the local
+        resolver cannot.
+        """
+        # URLs screened but not yet answered, in input order
+        screened = deque()
+
+        def webhooks():
+            for url in urls:
+                ok = _is_webhook(url)
+                screened.append((url, ok))
+                if ok:
+                    yield url
+
+        # Results arrive in webhook order, so the rejected URLs screened before
+        # each webhook are answered first
+        for status in super().check_many(webhooks(), max_workers):
+            url, ok = screened.popleft()
+            while not ok:
+                LOG.error("Error for link %s: not a webhook.office.com link", url)
+                yield None
+                url, ok = screened.popleft()
+            yield status
+
+        for url, _ in screened:
+            LOG.error("Error for link %s: not a webhook.office.com link", url)
+            yield None
@@ -4,9 +4,11 @@
 
 import requests
 import logging
+from functools import cached_property
 from typing import Optional
 
-from ..core.base import Checker
+from ..core.base import Checker, cached_check
+from ..core.http import create_session
 
 LOG = logging.getLogger(__name__)
 
@@ -19,11 +21,20 @@ class SnykAPITokenChecker(Checker):
 
     def __init__(self, notify: bool = False, debug: bool = False, timeout: int = 30) -> None:
         super().__init__(notify, debug, timeout)
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/vnd.api+json"})
         # endpoint chosen not to return sensitive data
         self._api = "https://api.snyk.io/rest/orgs?version=2023-11-06"
 
+    @cached_property
+    def session(self) -> requests.Session:
+        """HTTP session, created on first use so metadata lookups never open one."""
+        return create_session({"Content-Type": "application/vnd.api+json"})
+
+    @cached_property
+    def _request_template(self) -> requests.PreparedRequest:
+        """GET request to the API, prepared once; each check copies it and adds its token."""
+        return self.session.prepare_request(requests.Request("GET", self._api))
+
+    @cached_check
     def check(self, token: str) -> Optional[bool]:
         """Check if a Snyk API token is still active."""
 
@@ -31,11 +42,10 @@ class SnykAPITokenChecker(Checker):
             LOG.debug("Cannot notify Snyk API tokens")
 
         try:
-            request = self.session.prepare_request(
-                requests.Request("GET", self._api, headers={"Authorization": f"token {token}"})
-            )
+            request = self._request_template.copy()
+            request.headers["Authorization"] = f"token {token}"
             LOG.debug("Headers: %s", request.headers)
-            response = self.session.send(request, timeout=self.timeout)
+            response = self.session.send(request, timeout=self.http_timeout)
 
             LOG.debug(response.text)
             LOG.debug(response.status_code)
@@ -48,5 +58,5 @@ class SnykAPITokenChecker(Checker):
                 LOG.error("Error for token %s: %s; %s", token, response.status_code, response.text)
                 return None
         except Exception as e:
-            LOG.error(f"Error for token {token}: {e}")
+            LOG.error("Error for token %s: %s", token, e)
             return None
@@ -0,0 +1,74 @@
+"""Shared test fixtures."""
+
+import json
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import sys
+import threading
+
+# Add src to path for testing
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from validate_secrets.core.registry import ValidatorRegistry
+
+
+@pytest.fixture(scope="session")
+def registry():
+    """A validator registry shared by every test that only reads from it."""
+    return ValidatorRegistry()
+
+
+@pytest.fixture(scope="session")
+def all_validators(registry):
+    """All validators, loaded once per test session."""
+    return registry.load_validators()
+
+
+@pytest.fixture(scope="session")
+def sample_files(tmp_path_factory):
+    """Directory of small read-only text, CSV and JSON sources, written once per session."""
+    directory = tmp_path_factory.mktemp("sources")
+    (directory / "secrets.txt").write_text("secret1\nsecret2\n# comment\n\nsecret3\n")
+    (directory / "secrets.csv").write_text("secret,type\nsecret1,api_key\nsecret2,token\n")
+    (directory / "list.json").write_text(json.dumps(["secret1", "secret2", "secret3"]))
+    (directory / "objects.json").write_text(
+        json.dumps(
+            [{"secret": "secret1", "type": "api_key"}, {"secret": "secret2", "type": "token"}]
+        )
+    )
+    return directory
+
+
+@pytest.fixture
+def keepalive_server():
+    """Local HTTP/1.1 keep-alive server; yields its URL and the client ports it accepted."""
+    ports = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            ports.append(self.client_address[1])
+
+        def do_GET(self):
+            body = b'{"data": []}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", ports
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,82 @@
+"""Test the persistent result store."""
+
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import patch, MagicMock
+
+# Add src to path for testing
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from validate_secrets.core.cache import ResultStore
+from validate_secrets.validators.databricks_token import DatabricksTokenChecker
+from validate_secrets.validators.snyk_api_token import SnykAPITokenChecker
+
+
+class TestResultStore:
+    """Test storing and expiring results."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test that stored results are returned until they expire."""
+        store = ResultStore(tmp_path, ttl=60)
+        store.put("snyk_api_token", b"digest", False)
+
+        assert store.get("snyk_api_token", b"digest") is False
+        assert store.get("google_api_key", b"digest") is None
+
+        with patch("validate_secrets.core.cache.time.time", return_value=10**12):
+            assert store.get("snyk_api_token", b"digest") is None
+
+    def test_results_shared_between_runs(self, tmp_path):
+        """Test that a later validator reuses a result stored by an earlier one."""
+        first = SnykAPITokenChecker()
+        first.result_store = ResultStore(tmp_path, ttl=60)
+
+        with patch.object(first.session, "send") as mock_send:
+            mock_send.return_value = MagicMock(status_code=200, text="{}")
+            assert first.check("token-a") is True
+        first.result_store.close()
+
+        second = SnykAPITokenChecker()
+        second.result_store = ResultStore(tmp_path, ttl=60)
+
+        with patch.object(second.session, "send") as mock_send:
+            assert second.check("token-a") is True
+            mock_send.assert_not_called()
+
+        assert b"token-a" not in (tmp_path / "results.sqlite3").read_bytes()
+
+    def test_store_skipped_when_notifying(self, tmp_path):
+        """Test that notifying validators always contact the endpoint."""
+        store = ResultStore(tmp_path, ttl=60)
+        checker = SnykAPITokenChecker(notify=True)
+        checker.result_store = store
+
+        with patch.object(checker.session, "send") as mock_send:
+            mock_send.return_value = MagicMock(status_code=401, text="Unauthorized")
+            assert checker.check("token-a") is False
+
+        assert store.get("snyk_api_token", next(iter(checker._result_cache))) is None
+
+    def test_results_not_shared_between_hosts(self, tmp_path):
+        """Test that a token checked against one workspace is checked again on another."""
+        first = DatabricksTokenChecker(host_url="https://a.cloud.databricks.com")
+        first.result_store = ResultStore(tmp_path, ttl=60)
+
+        with patch.object(first.session, "send") as mock_send:
+            mock_send.return_value = MagicMock(status_code=200, text="{}")
+            assert first.check("dapi-a") is True
+        first.result_store.close()
+
+        second = DatabricksTokenChecker(host_url="https://b.cloud.databricks.com")
+        second.result_store = ResultStore(tmp_path, ttl=60)
+
+        with patch.object(second.session, "send") as mock_send:
+            mock_send.return_value = MagicMock(status_code=401, text="{}")
+            assert second.check("dapi-a") is False
+            mock_send.assert_called_once()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
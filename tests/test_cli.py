@@ -0,0 +1,105 @@
+"""Test the command line helpers."""
+
+import pytest
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+# Add src to path for testing
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from validate_secrets.cli import _check_secrets, _create_validator, _result_store, cli
+from validate_secrets.validators.databricks_token import DatabricksTokenChecker
+from validate_secrets.validators.fodselsnummer import FodselsNummerChecker
+
+
+class TestCheckSecrets:
+    """Test validating a batch of secrets of one type."""
+
+    def test_duplicates_checked_once(self):
+        """Test that each distinct secret is checked exactly once."""
+        checker = FodselsNummerChecker()
+
+        with patch.object(
+            FodselsNummerChecker, "check_many", autospec=True, side_effect=lambda self, s, **_: s
+        ) as mock_check_many:
+            statuses = _check_secrets(checker, ["123", "01010112345", "123"], 4, "Validating...")
+
+        mock_check_many.assert_called_once()
+        assert mock_check_many.call_args.args[1] == ["123", "01010112345"]
+        assert statuses == {"123": "123", "01010112345": "01010112345"}
+
+
+class TestCreateValidator:
+    """Test creating validators from shared options."""
+
+    def test_unsupported_kwargs_dropped(self):
+        """Test that options a validator does not accept are not passed to it."""
+        validator = _create_validator(
+            DatabricksTokenChecker, host_url="https://test.databricks.com", unused=True
+        )
+
+        assert validator.host_url == "https://test.databricks.com"
+        assert _create_validator(FodselsNummerChecker, host_url="ignored").result_store is None
+
+
+class TestCheckFile:
+    """Test the check-file command."""
+
+    def test_concurrency_option(self, tmp_path):
+        """Test that --concurrency overrides the configured number of parallel checks."""
+        secrets_file = tmp_path / "secrets.txt"
+        secrets_file.write_text("01010112345\n")
+
+        with patch("validate_secrets.cli._check_secrets", wraps=_check_secrets) as mock_check:
+            result = CliRunner().invoke(
+                cli,
+                ["check-file", str(secrets_file), "fodselsnummer", "--file-format", "text"]
+                + ["--concurrency", "4"],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert mock_check.call_args.args[2] == 4
+
+    def test_result_store_closed(self, tmp_path):
+        """Test that the result store is written and closed when the command finishes."""
+        secrets_file = tmp_path / "secrets.txt"
+        secrets_file.write_text("01010112345\n")
+        cache_dir = tmp_path / "cache"
+
+        with patch("validate_secrets.cli.ResultStore.close", autospec=True) as mock_close:
+            result = CliRunner(env={"VALIDATION_CACHE_DIR": str(cache_dir)}).invoke(
+                cli, ["check-file", str(secrets_file), "fodselsnummer", "--file-format", "text"]
+            )
+
+        assert result.exit_code == 0, result.output
+        mock_close.assert_called_once()
+
+
+class TestResultStore:
+    """Test opening the result store for a command."""
+
+    def test_opened_on_first_use(self, tmp_path):
+        """Test that no store file is created unless a validator asks for it."""
+        config = {"cache_dir": str(tmp_path / "cache"), "cache_ttl": 60}
+
+        with _result_store(config):
+            pass
+        assert not (tmp_path / "cache").exists()
+
+        with _result_store(config) as get_store:
+            store = get_store()
+            assert get_store() is store
+        assert (tmp_path / "cache").exists()
+
+    def test_disabled_without_cache_dir(self):
+        """Test that no store is opened when no cache directory is configured."""
+        with _result_store({"cache_dir": "", "cache_ttl": 60}) as get_store:
+            assert get_store() is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
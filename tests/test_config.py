@@ -0,0 +1,34 @@
+"""Test configuration loading."""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path for testing
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from validate_secrets.config import Config
+from validate_secrets.core.exceptions import ConfigurationError
+
+
+class TestValidationConfig:
+    """Test the validation settings read from the environment."""
+
+    def test_concurrency_from_env(self, monkeypatch):
+        """Test that VALIDATION_CONCURRENCY sets the number of parallel checks."""
+        monkeypatch.setenv("VALIDATION_CONCURRENCY", "8")
+
+        assert Config().validation_config["concurrency"] == 8
+
+    @pytest.mark.parametrize("value", ["0", "-4", "many"])
+    def test_invalid_concurrency_rejected(self, monkeypatch, value):
+        """Test that a concurrency below 1 or not a number is a configuration error."""
+        monkeypatch.setenv("VALIDATION_CONCURRENCY", value)
+
+        with pytest.raises(ConfigurationError, match="VALIDATION_CONCURRENCY"):
+            Config().validation_config
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -5,14 +5,26 @@ from pathlib import Path
 import sys
 from unittest.mock import patch, MagicMock
 import os
+import threading
+import time
 
 # Add src to path for testing
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
-from validate_secrets.sources.github import GitHubSource
+from validate_secrets.sources.dedup import DedupSource
+from validate_secrets.sources.github import PAGE_FETCH_WORKERS, GitHubSource
 from validate_secrets.core.exceptions import SourceError
 
+ALERTS_URL = "https://api.github.com/repos/test-owner/test-repo/secret-scanning/alerts"
+
+
+def github_response(json_data=None, status=200, headers=None, text=""):
+    """Build a canned GitHub API response for a patched Session.get."""
+    response = MagicMock(status_code=status, headers=headers or {}, text=text)
+    response.json.return_value = json_data if json_data is not None else []
+    return response
+
 
 class TestGitHubSource:
     """Test the GitHub data source."""
@@ -32,30 +44,54 @@ class TestGitHubSource:
             assert source.repo == "test-owner/test-repo"
             assert source.token == "test-token"
 
+    def test_session_requests_compressed_responses(self):
+        """Test that the session asks GitHub for compressed responses."""
+        with patch.dict(os.environ, {}, clear=True):
+            source = GitHubSource(token="test-token", repo="test-owner/test-repo")
+            assert "gzip" in source.session.headers["Accept-Encoding"]
+
+    def test_adapter_leaves_status_retries_to_source(self):
+        """Test that the session only retries connections, so _get sees every status."""
+        with patch.dict(os.environ, {}, clear=True):
+            source = GitHubSource(token="test-token", repo="test-owner/test-repo")
+
+        retry = source.session.get_adapter("https://api.github.com").max_retries
+        assert retry.connect == 2
+        assert not retry.is_retry("GET", 429, has_retry_after=True)
+        assert not retry.is_retry("GET", 503)
+
+    def test_session_shared_per_token(self):
+        """Test that sources for the same API and token reuse one session."""
+        with patch.dict(os.environ, {}, clear=True):
+            a = GitHubSource(token="test-token", repo="test-owner/test-repo")
+            b = GitHubSource(token="test-token", org="test-owner")
+            c = GitHubSource(token="other-token", repo="test-owner/test-repo")
+
+        assert a.session is b.session
+        assert a.session is not c.session
+        assert c.session.headers["Authorization"] == "token other-token"
+
     @patch("validate_secrets.sources.github.requests.Session.get")
     def test_get_secrets_success(self, mock_get):
         """Test successful secret scanning."""
-        # Mock the GitHub API response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {
-                "number": 1,
-                "secret_type": "api_key",
-                "secret": "test-secret-1",
-                "locations": [{"path": "config.py", "start_line": 10}],
-                "state": "open",
-            },
-            {
-                "number": 2,
-                "secret_type": "token",
-                "secret": "test-secret-2",
-                "locations": [{"path": "app.py", "start_line": 25}],
-                "state": "open",
-            },
-        ]
-        mock_response.headers = {}
-        mock_get.return_value = mock_response
+        mock_get.return_value = github_response(
+            [
+                {
+                    "number": 1,
+                    "secret_type": "api_key",
+                    "secret": "test-secret-1",
+                    "locations": [{"path": "config.py", "start_line": 10}],
+                    "state": "open",
+                },
+                {
+                    "number": 2,
+                    "secret_type": "token",
+                    "secret": "test-secret-2",
+                    "locations": [{"path": "app.py", "start_line": 25}],
+                    "state": "open",
+                },
+            ]
+        )
 
         with patch.dict(os.environ, {}, clear=True):
             source = GitHubSource(token="test-token", repo="test-owner/test-repo")
@@ -65,14 +101,38 @@ class TestGitHubSource:
             assert secrets[0]["secret"] == "test-secret-1"
             assert secrets[0]["type"] == "api_key"
             assert secrets[0]["metadata"]["alert_number"] == 1
+            assert mock_get.call_count == 1
+            assert mock_get.call_args.args[0] == ALERTS_URL
+            assert mock_get.call_args.kwargs["params"]["per_page"] == 100
+            assert mock_get.call_args.kwargs["params"]["state"] == "open"
+
+    @patch("validate_secrets.sources.github.requests.Session.get")
+    def test_next_link_followed(self, mock_get):
+        """Test that a rel="next" link without a numbered last page is followed."""
+        first = github_response(
+            [{"number": 1, "secret_type": "api_key", "secret": "s1"}],
+            headers={"Link": '<https://api.github.com/alerts?after=abc>; rel="next"'},
+        )
+        second = github_response([{"number": 2, "secret_type": "api_key", "secret": "s2"}])
+        mock_get.side_effect = [first, second]
+
+        with patch.dict(os.environ, {}, clear=True):
+            source = GitHubSource(token="test-token", repo="test-owner/test-repo", per_page=50)
+            secrets = list(source.get_secrets())
+
+        assert [s["secret"] for s in secrets] == ["s1", "s2"]
+        assert mock_get.call_args_list[0].kwargs["params"]["per_page"] == 50
+        assert mock_get.call_args_list[1].args[0] == "https://api.github.com/alerts?after=abc"
+
+    def test_per_page_limit(self):
+        """Test that page sizes GitHub would reject are refused up front."""
+        with pytest.raises(SourceError, match="per_page"):
+            GitHubSource(token="test-token", repo="test-owner/test-repo", per_page=101)
 
     @patch("validate_secrets.sources.github.requests.Session.get")
     def test_get_secrets_api_error(self, mock_get):
         """Test API error handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 403
-        mock_response.text = "Forbidden"
-        mock_get.return_value = mock_response
+        mock_get.return_value = github_response(status=403, text="Forbidden")
 
         with patch.dict(os.environ, {}, clear=True):
             source = GitHubSource(token="test-token", repo="test-owner/test-repo")
@@ -80,6 +140,163 @@ class TestGitHubSource:
             with pytest.raises(SourceError, match="GitHub access forbidden"):
                 list(source.get_secrets())
 
+    @patch("validate_secrets.sources.github.time.sleep")
+    @patch("validate_secrets.sources.github.requests.Session.get")
+    def test_rate_limited_request_retried(self, mock_get, mock_sleep):
+        """Test that a 429 is retried after the Retry-After delay."""
+        limited = github_response(status=429, headers={"Retry-After": "0"})
+        ok = github_response([{"number": 1, "secret_type": "api_key", "secret": "s1"}])
+        mock_get.side_effect = [limited, ok]
+
+        with patch.dict(os.environ, {}, clear=True):
+            source = GitHubSource(token="test-token", repo="test-owner/test-repo")
+            secrets = list(source.get_secrets())
+
+        assert [s["secret"] for s in secrets] == ["s1"]
+        assert mock_get.call_count == 2
+        # A Retry-After of 0 still waits out the first backoff step
+        mock_sleep.assert_called_once_with(1)
+
+    @patch("validate_secrets.sources.github.time.sleep")
+    @patch("validate_secrets.sources.github.requests.Session.get")
+    def test_secondary_rate_limit_retried(self, mock_get, mock_sleep):
+        """Test that a 403 with Retry-After is retried even with rate limit remaining."""
+        limited = github_response(
+            status=403, headers={"Retry-After": "30", "X-RateLimit-Remaining": "4000"}
+        )
+        ok = github_response([{"number": 1, "secret_type": "api_key", "secret": "s1"}])
+        mock_get.side_effect = [limited, ok]
+
+        with patch.dict(os.environ, {}, clear=True):
+            source = GitHubSource(token="test-token", repo="test-owner/test-repo")
+            secrets = list(source.get_secrets())
+
+        assert [s["secret"] for s in secrets] == ["s1"]
+        mock_sleep.assert_called_once_with(30)
+
+    @patch("validate_secrets.sources.github.time.sleep")
+    @patch("validate_secrets.sources.github.requests.Session.get")
+    def test_rate_limit_without_reset_backs_off(self, mock_get, mock_sleep):
+        """Test that an exhausted rate limit with no reset header still backs off."""
+        limited = github_response(status=403, headers={"X-RateLimit-Remaining": "0"})
+        mock_get.side_effect = [limited, limited, github_response([])]
+
+        with patch.dict(os.environ, {}, clear=True):
+            source = GitHubSource(token="test-token", repo="test-owner/test-repo")
+            assert list(source.get_secrets()) == []
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2]
+
+    @patch("validate_secrets.sources.github.time.sleep")
+    @patch("validate_secrets.sources.github.time.time", return_value=1000)
+    @patch("validate_secrets.sources.github.requests.Session.get")
+    def test_exhausted_rate_limit_waits_for_reset(self, mock_get, mock_time, mock_sleep):
+        """Test that using up the rate limit waits until it resets."""
+        mock_get.return_value = github_response(
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"}
+        )
+
+        with patch.dict(os.environ, {}, clear=True):
+            source = GitHubSource(token="test-token", repo="test-owner/test-repo")
+            assert list(source.get_secrets()) == []
+
+        mock_sleep.assert_called_once_with(30)
+
+    def test_get_next_page_url(self):
+        """Test extracting the rel="next" link from the Link header."""
+        with patch.dict(os.environ, {}, clear=True):
+            source = GitHubSource(token="test-token", repo="test-owner/test-repo")
+
+        response = MagicMock()
+        response.headers = {
+            "Link": '<https://api.github.com/alerts?page=1>; rel="prev", '
+            '<https://api.github.com/alerts?page=3>; rel="next", '
+            '<https://api.github.com/alerts?page=9>; rel="last"'
+        }
+        assert source._get_next_page_url(response) == "https://api.github.com/alerts?page=3"
+
+        response.headers = {"Link": '<https://api.github.com/alerts?page=1>; rel="first"'}
+        assert source._get_next_page_url(response) is None
+
+        response.headers = {}
+        assert source._get_next_page_url(response) is None
+
+    @patch("validate_secrets.sources.github.requests.Session.get")
+    def test_failed_page_stops_fetching(self, mock_get):
+        """Test that a failing page raises at once and later pages are never requested."""
+        release = threading.Event()
+        requested = []
+
+        def page_response(url, params=None):
+            page = int(url.rsplit("page=", 1)[1]) if "page=" in url else 1
+            requested.append(page)
+            if page == 1:
+                return github_response(
+                    headers={"Link": f'<{ALERTS_URL}?per_page=2&page=50>; rel="last"'}
+                )
+            if page == 2:
+                return github_response(status=404)
+            # Other pages in flight are still waiting on the API
+            release.wait(5)
+            return github_response()
+
+        mock_get.side_effect = page_response
+
+        with patch.dict(os.environ, {}, clear=True):
+            source = GitHubSource(token="test-token", repo="test-owner/test-repo")
+            started = time.monotonic()
+            with pytest.raises(SourceError, match="not found"):
+                list(source.get_secrets())
+            elapsed = time.monotonic() - started
+        release.set()
+
+        assert elapsed < 2
+        assert max(requested) <= 1 + PAGE_FETCH_WORKERS
+
+    @patch("validate_secrets.sources.github.requests.Session.get")
+    def test_numbered_pages_fetched_in_order(self, mock_get):
+        """Test that pages up to rel="last" are all fetched and yielded in page order."""
+
+        def page_response(url, params=None):
+            page = int(url.rsplit("page=", 1)[1]) if "page=" in url else 1
+            return github_response(
+                [
+                    {"number": page * 10 + i, "secret_type": "api_key", "secret": f"s{page}-{i}"}
+                    for i in range(2)
+                ],
+                headers=(
+                    {
+                        "Link": f'<{ALERTS_URL}?per_page=2&page=2>; rel="next", '
+                        f'<{ALERTS_URL}?per_page=2&page=3>; rel="last"'
+                    }
+                    if page == 1
+                    else {}
+                ),
+            )
+
+        mock_get.side_effect = page_response
+
+        with patch.dict(os.environ, {}, clear=True):
+            source = GitHubSource(token="test-token", repo="test-owner/test-repo")
+            secrets = list(source.get_secrets())
+
+        assert [s["metadata"]["alert_number"] for s in secrets] == [10, 11, 20, 21, 30, 31]
+        assert mock_get.call_count == 3
+
+    @patch("validate_secrets.sources.github.requests.Session.get")
+    def test_dedup_by_secret(self, mock_get):
+        """Test that alerts for the same secret are yielded once with every alert number."""
+        mock_get.return_value = github_response(
+            [{"number": n, "secret_type": "api_key", "secret": "shared"} for n in (1, 2, 3)]
+        )
+
+        with patch.dict(os.environ, {}, clear=True):
+            source = DedupSource(GitHubSource(token="test-token", repo="test-owner/test-repo"))
+            secrets = list(source.get_secrets())
+
+        assert len(secrets) == 1
+        assert secrets[0]["metadata"]["alert_numbers"] == [1, 2, 3]
+
     def test_get_name(self):
         """Test the get_name method."""
         with patch.dict(os.environ, {}, clear=True):
@@ -114,41 +331,41 @@ class TestGitHubDynamicValidatorIntegration:
             source = GitHubSource("test-owner", "test-repo")
 
             # Mock API response with GitHub secret types
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = [
-                {
-                    "number": 1,
-                    "secret_type": "google_api_key",
-                    "secret": "AIzaSyB1234567890123456789012345678901",
-                    "state": "open",
-                    "repository": {"full_name": "test-owner/test-repo"},
-                    "created_at": "2023-01-01T00:00:00Z",
-                    "updated_at": "2023-01-01T00:00:00Z",
-                    "html_url": "https://github.com/test-owner/test-repo/security/secret-scanning/1",
-                    "secret_type_display_name": "Google API Key",
-                    "locations": [],
-                },
-                {
-                    "number": 2,
-                    "secret_type": "microsoft_teams_webhook",
-                    "secret": "https://outlook.office.com/webhook/test",
-                    "state": "open",
-                    "repository": {"full_name": "test-owner/test-repo"},
-                    "created_at": "2023-01-02T00:00:00Z",
-                    "updated_at": "2023-01-02T00:00:00Z",
-                    "html_url": "https://github.com/test-owner/test-repo/security/secret-scanning/2",
-                    "secret_type_display_name": "Microsoft Teams Webhook",
-                    "locations": [],
-                },
-            ]
-            mock_response.headers = {}
-            mock_get.return_value = mock_response
+            mock_get.return_value = github_response(
+                [
+                    {
+                        "number": 1,
+                        "secret_type": "google_api_key",
+                        "secret": "AIzaSyB1234567890123456789012345678901",
+                        "state": "open",
+                        "repository": {"full_name": "test-owner/test-repo"},
+                        "created_at": "2023-01-01T00:00:00Z",
+                        "updated_at": "2023-01-01T00:00:00Z",
+                        "html_url": "https://github.com/test-owner/test-repo/security/secret-scanning/1",
+                        "secret_type_display_name": "Google API Key",
+                        "locations": [],
+                    },
+                    {
+                        "number": 2,
+                        "secret_type": "microsoft_teams_webhook",
+                        "secret": "https://outlook.office.com/webhook/test",
+                        "state": "open",
+                        "repository": {"full_name": "test-owner/test-repo"},
+                        "created_at": "2023-01-02T00:00:00Z",
+                        "updated_at": "2023-01-02T00:00:00Z",
+                        "html_url": "https://github.com/test-owner/test-repo/security/secret-scanning/2",
+                        "secret_type_display_name": "Microsoft Teams Webhook",
+                        "locations": [],
+                    },
+                ]
+            )
 
             # Get secrets and verify they use GitHub secret types directly
             secrets = list(source.get_secrets())
 
             assert len(secrets) == 2
+            assert mock_get.call_count == 1
+            assert mock_get.call_args.kwargs["params"]["state"] == "open"
 
             # First secret
             assert secrets[0]["type"] == "google_api_key"
@@ -164,7 +381,7 @@ class TestGitHubDynamicValidatorIntegration:
     def test_github_cli_integration_without_mapping(self):
         """Test that CLI can process GitHub alerts without manual mapping."""
         # This test verifies the CLI would work with direct validator lookup
-        from validate_secrets.core.registry import get_validator
+        from validate_secrets.core.registry import get_validator, validator_names
 
         # Simulate GitHub alerts with various secret types
         github_alerts = [
@@ -177,22 +394,24 @@ class TestGitHubDynamicValidatorIntegration:
             {"secret_type": "unknown_type", "secret": "unknown-secret"},  # Should be skipped
         ]
 
+        known_types = validator_names()
         processable_alerts = 0
         skipped_alerts = 0
 
         for alert in github_alerts:
             github_secret_type = alert["secret_type"]
 
-            try:
-                validator_class = get_validator(github_secret_type)
-                validator = validator_class(debug=False, timeout=5)
+            # Unknown types are skipped by a set lookup rather than a ValidatorError
+            if github_secret_type not in known_types:
+                skipped_alerts += 1
+                continue
 
-                assert hasattr(validator, "check")
-                assert validator.name == github_secret_type
-                processable_alerts += 1
+            validator_class = get_validator(github_secret_type)
+            validator = validator_class(debug=False, timeout=5)
 
-            except Exception:
-                skipped_alerts += 1
+            assert hasattr(validator, "check")
+            assert validator.name == github_secret_type
+            processable_alerts += 1
 
         # We should be able to process 3 out of 4 alerts
         assert processable_alerts == 3, f"Expected 3 processable alerts, got {processable_alerts}"
@@ -9,48 +9,51 @@ src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
 from validate_secrets.core.registry import (
+    VALIDATORS_PACKAGE,
     ValidatorRegistry,
+    discover_validators,
     get_validators,
     get_validator,
     list_validators,
 )
 from validate_secrets.core.base import Checker
 from validate_secrets.core.exceptions import ValidatorError
+from validate_secrets.core._registry_table import TABLE
 
 
 class TestValidatorRegistry:
     """Test cases for ValidatorRegistry."""
 
-    def test_load_validators(self):
+    def test_load_validators(self, all_validators):
         """Test that validators are loaded correctly."""
-        registry = ValidatorRegistry()
-        validators = registry.load_validators()
+        assert len(all_validators) > 0
+        assert "fodselsnummer" in all_validators
+        assert "google_api_key" in all_validators
+        assert "microsoft_teams_webhook" in all_validators
+        assert "snyk_api_token" in all_validators
+        assert "databricks_token" in all_validators
 
-        assert len(validators) > 0
-        assert "fodselsnummer" in validators
-        assert "google_api_key" in validators
-        assert "microsoft_teams_webhook" in validators
-        assert "snyk_api_token" in validators
-        assert "databricks_token" in validators
+    def test_loaded_validators_are_read_only(self, registry, all_validators):
+        """Test that callers cannot modify the registry through the returned mapping."""
+        with pytest.raises(TypeError):
+            all_validators["fodselsnummer"] = None
 
-    def test_get_validator(self):
+        assert registry.load_validators() is all_validators
+
+    def test_get_validator(self, registry):
         """Test getting a specific validator."""
-        registry = ValidatorRegistry()
         validator_class = registry.get_validator("fodselsnummer")
 
         assert validator_class is not None
         assert issubclass(validator_class, Checker)
 
-    def test_get_unknown_validator(self):
+    def test_get_unknown_validator(self, registry):
         """Test error handling for unknown validator."""
-        registry = ValidatorRegistry()
-
         with pytest.raises(ValidatorError):
             registry.get_validator("unknown_validator")
 
-    def test_list_validators(self):
+    def test_list_validators(self, registry):
         """Test listing validators."""
-        registry = ValidatorRegistry()
         validator_names = registry.list_validators()
 
         assert isinstance(validator_names, list)
@@ -58,6 +61,59 @@ class TestValidatorRegistry:
         assert "fodselsnummer" in validator_names
 
 
+class TestRegistryTable:
+    """Test the generated validator lookup table."""
+
+    def test_table_matches_discovery(self):
+        """Test that the table is up to date; run scripts/gen_registry.py if this fails."""
+        assert discover_validators() == {
+            name: (f"{VALIDATORS_PACKAGE}.{module}", class_name)
+            for name, (module, class_name) in TABLE.items()
+        }
+
+    def test_table_modules_skipped_by_discovery(self, monkeypatch):
+        """Test that discovery skips every table module, so none is imported twice."""
+        skipped = []
+        monkeypatch.setattr(
+            "validate_secrets.core.registry.discover_validators",
+            lambda skip_modules=(): skipped.extend(skip_modules) or {},
+        )
+
+        ValidatorRegistry()._load_table()
+
+        assert sorted(skipped) == sorted(module for module, _ in discover_validators().values())
+
+    def test_empty_table_built_once(self, monkeypatch):
+        """Test that a registry without validators does not rescan on every lookup."""
+        scans = []
+        monkeypatch.setattr("validate_secrets.core.registry.TABLE", {})
+        monkeypatch.setattr(
+            "validate_secrets.core.registry.discover_validators",
+            lambda skip_modules=(): scans.append(skip_modules) or {},
+        )
+
+        registry = ValidatorRegistry()
+        assert registry.list_validators() == []
+        assert registry.list_validators() == []
+
+        assert len(scans) == 1
+
+    def test_list_validators_does_not_import(self):
+        """Test that listing validators does not import any validator class."""
+        registry = ValidatorRegistry()
+        names = registry.list_validators()
+
+        assert names[: len(TABLE)] == list(TABLE)
+        assert registry._validators == {}
+
+    def test_get_validator_imports_only_requested(self):
+        """Test that getting one validator resolves only that validator."""
+        registry = ValidatorRegistry()
+        registry.get_validator("fodselsnummer")
+
+        assert list(registry._validators) == ["fodselsnummer"]
+
+
 class TestDynamicGitHubValidatorMapping:
     """Test dynamic GitHub secret type to validator mapping functionality."""
 
@@ -213,9 +269,8 @@ class TestDynamicGitHubValidatorMapping:
                 validator, "check"
             ), f"Validator for '{github_type}' missing check method"
 
-    def test_get_validator_info(self):
+    def test_get_validator_info(self, registry):
         """Test getting validator metadata."""
-        registry = ValidatorRegistry()
         info = registry.get_validator_info()
 
         assert isinstance(info, dict)
@@ -241,6 +296,13 @@ class TestGlobalFunctions:
         validator_class = get_validator("fodselsnummer")
         assert issubclass(validator_class, Checker)
 
+    def test_get_validator_cached(self):
+        """Test that repeated lookups of the same name hit the cache."""
+        get_validator.cache_clear()
+
+        assert get_validator("google_api_key") is get_validator("google_api_key")
+        assert get_validator.cache_info().hits >= 1
+
     def test_list_validators(self):
         """Test the global list_validators function."""
         names = list_validators()
@@ -262,11 +324,9 @@ class TestValidatorInstantiation:
         result = validator.check("invalid")
         assert result is False
 
-    def test_instantiate_all_validators(self):
+    def test_instantiate_all_validators(self, all_validators):
         """Test that all validators can be instantiated."""
-        validators = get_validators()
-
-        for name, validator_class in validators.items():
+        for name, validator_class in all_validators.items():
             validator = validator_class()
             assert validator is not None
             assert hasattr(validator, "check")
@@ -2,15 +2,16 @@
 
 import pytest
 import json
-import csv
 from pathlib import Path
 import tempfile
+import tracemalloc
 import sys
 
 # Add src to path for testing
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
+from validate_secrets.sources.dedup import DedupSource
 from validate_secrets.sources.file import FileSource
 from validate_secrets.core.exceptions import SourceError
 
@@ -18,96 +19,133 @@ from validate_secrets.core.exceptions import SourceError
 class TestFileSource:
     """Test the file data source."""
 
-    def test_text_file(self):
+    def test_text_file(self, sample_files):
         """Test reading from text file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("secret1\n")
-            f.write("secret2\n")
-            f.write("# comment\n")
-            f.write("\n")  # empty line
-            f.write("secret3\n")
-            temp_path = f.name
+        path = sample_files / "secrets.txt"
+        source = FileSource(str(path), "text", "test_type")
+        secrets = list(source.get_secrets())
 
-        try:
-            source = FileSource(temp_path, "text", "test_type")
-            secrets = list(source.get_secrets())
+        assert len(secrets) == 3
+        assert secrets[0]["secret"] == "secret1"
+        assert secrets[1]["secret"] == "secret2"
+        assert secrets[2]["secret"] == "secret3"
 
-            assert len(secrets) == 3
-            assert secrets[0]["secret"] == "secret1"
-            assert secrets[1]["secret"] == "secret2"
-            assert secrets[2]["secret"] == "secret3"
+        # Check metadata
+        assert secrets[0]["metadata"]["line"] == 1
+        assert secrets[0]["metadata"]["source"] == str(path)
 
-            # Check metadata
-            assert secrets[0]["metadata"]["line"] == 1
-            assert secrets[0]["metadata"]["source"] == temp_path
+    def test_csv_file(self, sample_files):
+        """Test reading from CSV file."""
+        source = FileSource(str(sample_files / "secrets.csv"), "csv")
+        secrets = list(source.get_secrets())
+
+        assert len(secrets) == 2
+        assert secrets[0]["secret"] == "secret1"
+        assert secrets[1]["secret"] == "secret2"
+        assert secrets[0]["type"] == "api_key"
+
+        # Check metadata
+        assert secrets[0]["metadata"]["row"] == 2
+        assert "csv_data" in secrets[0]["metadata"]
+
+    def test_csv_short_and_long_rows(self, tmp_path):
+        """Test that uneven rows keep csv.DictReader's padding and extra fields."""
+        path = tmp_path / "uneven.csv"
+        path.write_text("secret,type,note\nsecret1\nsecret2,api_key,n,extra1,extra2\n")
+
+        secrets = list(FileSource(str(path), "csv", "token").get_secrets())
+
+        assert secrets[0]["metadata"]["csv_data"] == {
+            "secret": "secret1",
+            "type": None,
+            "note": None,
+        }
+        assert secrets[0]["type"] == "token"
+        assert secrets[1]["metadata"]["csv_data"] == {
+            "secret": "secret2",
+            "type": "api_key",
+            "note": "n",
+            None: ["extra1", "extra2"],
+        }
+
+    def test_json_file_list(self, sample_files):
+        """Test reading from JSON file with list format."""
+        source = FileSource(str(sample_files / "list.json"), "json", "test_type")
+        secrets = list(source.get_secrets())
 
-        finally:
-            Path(temp_path).unlink()
+        assert len(secrets) == 3
+        assert secrets[0]["secret"] == "secret1"
+        assert secrets[0]["type"] == "test_type"
+        assert secrets[0]["metadata"]["index"] == 0
 
-    def test_csv_file(self):
-        """Test reading from CSV file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            writer = csv.writer(f)
-            writer.writerow(["secret", "type"])
-            writer.writerow(["secret1", "api_key"])
-            writer.writerow(["secret2", "token"])
+    def test_json_file_objects(self, sample_files):
+        """Test reading from JSON file with object format."""
+        source = FileSource(str(sample_files / "objects.json"), "json")
+        secrets = list(source.get_secrets())
+
+        assert len(secrets) == 2
+        assert secrets[0]["secret"] == "secret1"
+        assert secrets[0]["type"] == "api_key"
+        assert secrets[1]["type"] == "token"
+
+    def test_json_file_streamed_across_reads(self, monkeypatch):
+        """Test that JSON arrays split across many small reads decode correctly."""
+        test_data = [{"secret": f"secret{i}", "type": "api_key"} for i in range(50)]
+        test_data += ["plain-secret", {"value": "2.5e3"}]
+
+        monkeypatch.setattr("validate_secrets.sources.file.JSON_READ_SIZE", 7)
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(test_data, f, indent=2)
             temp_path = f.name
 
         try:
-            source = FileSource(temp_path, "csv")
+            source = FileSource(temp_path, "json", "fallback_type")
             secrets = list(source.get_secrets())
 
-            assert len(secrets) == 2
-            assert secrets[0]["secret"] == "secret1"
-            assert secrets[1]["secret"] == "secret2"
-            assert secrets[0]["type"] == "api_key"
-
-            # Check metadata
-            assert secrets[0]["metadata"]["row"] == 2
-            assert "csv_data" in secrets[0]["metadata"]
+            assert len(secrets) == 52
+            assert secrets[49]["secret"] == "secret49"
+            assert secrets[49]["metadata"]["json_data"] == test_data[49]
+            assert secrets[50]["secret"] == "plain-secret"
+            assert secrets[50]["type"] == "fallback_type"
+            assert secrets[51]["secret"] == "2.5e3"
 
         finally:
             Path(temp_path).unlink()
 
-    def test_json_file_list(self):
-        """Test reading from JSON file with list format."""
-        test_data = ["secret1", "secret2", "secret3"]
-
+    def test_json_streaming_large_file(self):
+        """Test that memory use while reading a large JSON array does not grow with the file."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(test_data, f)
+            json.dump([{"secret": f"secret{i}", "type": "api_key"} for i in range(100_000)], f)
             temp_path = f.name
 
         try:
-            source = FileSource(temp_path, "json", "test_type")
-            secrets = list(source.get_secrets())
+            source = FileSource(temp_path, "json")
+            file_size = Path(temp_path).stat().st_size
+
+            tracemalloc.start()
+            try:
+                count = sum(1 for _ in source.get_secrets())
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
 
-            assert len(secrets) == 3
-            assert secrets[0]["secret"] == "secret1"
-            assert secrets[0]["type"] == "test_type"
-            assert secrets[0]["metadata"]["index"] == 0
+            assert count == 100_000
+            assert peak < file_size / 10
 
         finally:
             Path(temp_path).unlink()
 
-    def test_json_file_objects(self):
-        """Test reading from JSON file with object format."""
-        test_data = [
-            {"secret": "secret1", "type": "api_key"},
-            {"secret": "secret2", "type": "token"},
-        ]
-
+    def test_malformed_json_array(self):
+        """Test that a truncated JSON array raises a SourceError."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(test_data, f)
+            f.write('["secret1", "secr')
             temp_path = f.name
 
         try:
-            source = FileSource(temp_path, "json")
-            secrets = list(source.get_secrets())
-
-            assert len(secrets) == 2
-            assert secrets[0]["secret"] == "secret1"
-            assert secrets[0]["type"] == "api_key"
-            assert secrets[1]["type"] == "token"
+            source = FileSource(temp_path, "json", "test_type")
+            with pytest.raises(SourceError):
+                list(source.get_secrets())
 
         finally:
             Path(temp_path).unlink()
@@ -132,5 +170,39 @@ class TestFileSource:
             assert Path(f.name).name in name
 
 
+class TestDedupSource:
+    """Test the deduplicating source wrapper."""
+
+    def test_duplicates_merged_into_first_record(self):
+        """Test that repeated secrets are yielded once with their metadata collected."""
+        test_data = [
+            {"secret": "secret1", "type": "api_key"},
+            {"secret": "secret2", "type": "api_key"},
+            {"secret": "secret1", "type": "api_key"},
+            {"secret": "secret1", "type": "token"},
+        ]
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(test_data, f)
+            temp_path = f.name
+
+        try:
+            source = DedupSource(FileSource(temp_path, "json"))
+            secrets = list(source.get_secrets())
+
+            assert [(s["secret"], s["type"]) for s in secrets] == [
+                ("secret1", "api_key"),
+                ("secret2", "api_key"),
+                ("secret1", "token"),
+            ]
+            duplicates = secrets[0]["metadata"]["duplicates"]
+            assert [d["index"] for d in duplicates] == [2]
+            assert "duplicates" not in secrets[1]["metadata"]
+            assert source.get_name() == f"File: {Path(temp_path).name}"
+
+        finally:
+            Path(temp_path).unlink()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
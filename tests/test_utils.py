@@ -0,0 +1,101 @@
+"""Test output helpers."""
+
+import csv
+import json
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path for testing
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from validate_secrets.utils import output_csv, output_json
+
+
+class TestOutputCsv:
+    """Test the CSV output."""
+
+    def test_rows_from_generator(self, tmp_path):
+        """Test that every result becomes one row after the header."""
+        results = [
+            {
+                "secret": "secret1",
+                "type": "api_key",
+                "status": "valid",
+                "metadata": {"source": "a"},
+            },
+            {"secret": "secret2", "type": "api_key", "status": "error", "metadata": {}},
+        ]
+        output_file = tmp_path / "results.csv"
+
+        output_csv((r for r in results), str(output_file))
+
+        with open(output_file, newline="") as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == ["secret", "type", "status", "source", "metadata"]
+        assert rows[1] == ["secret1", "api_key", "valid", "a", '{"source": "a"}']
+        assert rows[2] == ["secret2", "api_key", "error", "Unknown", ""]
+
+
+class TestOutputJson:
+    """Test the streaming JSON output."""
+
+    def test_streamed_document_is_valid_json(self, tmp_path):
+        """Test that results written from a generator form a valid document."""
+        results = [
+            {"secret": "secret1", "type": "api_key", "status": "valid", "metadata": {"line": 1}},
+            {"secret": "secret2", "type": "api_key", "status": "invalid", "metadata": {}},
+        ]
+        output_file = tmp_path / "results.json"
+
+        output_json((r for r in results), str(output_file))
+
+        data = json.loads(output_file.read_text())
+        assert data["total_secrets"] == 2
+        assert data["results"] == results
+
+    def test_one_result_per_line(self, tmp_path):
+        """Test that each result is written on a single line."""
+        results = [
+            {"secret": "secret1", "type": "api_key", "status": "valid", "metadata": {"line": 1}},
+            {"secret": "secret2", "type": "api_key", "status": "invalid", "metadata": {}},
+        ]
+        output_file = tmp_path / "results.json"
+
+        output_json(iter(results), str(output_file))
+
+        lines = output_file.read_text().splitlines()
+        assert json.loads(lines[3].rstrip(",")) == results[0]
+        assert json.loads(lines[4]) == results[1]
+
+    def test_empty_results(self, tmp_path):
+        """Test that an empty result set is still a valid document."""
+        output_file = tmp_path / "results.json"
+
+        output_json(iter([]), str(output_file))
+
+        data = json.loads(output_file.read_text())
+        assert data["total_secrets"] == 0
+        assert data["results"] == []
+
+
+class TestOutputFile:
+    """Test that output files are only replaced by complete results."""
+
+    @pytest.mark.parametrize("output", [output_csv, output_json])
+    def test_failed_run_keeps_previous_file(self, tmp_path, output):
+        """Test that an error while results are produced leaves the old file in place."""
+        output_file = tmp_path / "results"
+        output_file.write_text("previous results")
+
+        def results():
+            yield {"secret": "s1", "type": "api_key", "status": "valid", "metadata": {}}
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            output(results(), str(output_file))
+
+        assert output_file.read_text() == "previous results"
+        assert list(tmp_path.iterdir()) == [output_file]
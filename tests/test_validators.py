@@ -1,15 +1,19 @@
 """Test individual validators."""
 
 import pytest
+import json
+import time
 from pathlib import Path
 import sys
+from unittest.mock import patch, MagicMock
 
 # Add src to path for testing
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
+from validate_secrets.core.base import CONNECT_TIMEOUT
 from validate_secrets.validators.fodselsnummer import FodselsNummerChecker
-from validate_secrets.validators.google_api_keys import GoogleApiKeyChecker
+from validate_secrets.validators.google_api_keys import GOOGLE_MAPS_URL, GoogleApiKeyChecker
 from validate_secrets.validators.microsoft_teams_webhook import OfficeWebHookChecker
 from validate_secrets.validators.snyk_api_token import SnykAPITokenChecker
 from validate_secrets.validators.databricks_token import DatabricksTokenChecker
@@ -47,6 +51,32 @@ class TestDatabricksTokenChecker:
         result = checker.check("dapi_fake_token_123")
         assert result is None
 
+    def test_requests_share_prepared_template(self):
+        """Test that each check sends its own token on a copy of the prepared request."""
+        checker = DatabricksTokenChecker(host_url="https://my-workspace.databricks.com")
+
+        with patch.object(checker.session, "send") as mock_send:
+            mock_send.return_value = MagicMock(status_code=401)
+            assert checker.check("dapi-a") is False
+            assert checker.check("dapi-b") is False
+            # Repeat checks of a token are answered from the result cache
+            assert checker.check("dapi-a") is False
+
+        sent = [call.args[0] for call in mock_send.call_args_list]
+        assert [r.headers["Authorization"] for r in sent] == ["Bearer dapi-a", "Bearer dapi-b"]
+        assert sent[0].url == "https://my-workspace.databricks.com/api/2.0/token/list"
+        assert "Authorization" not in checker._request_template.headers
+
+    def test_connection_reused(self, keepalive_server):
+        """Test that consecutive checks share one keep-alive connection."""
+        url, ports = keepalive_server
+        checker = DatabricksTokenChecker(host_url=url)
+
+        for i in range(5):
+            assert checker.check(f"dapi-{i}") is True
+
+        assert len(ports) == 1
+
 
 class TestFodselsNummerChecker:
     """Test the Norwegian national ID validator."""
@@ -64,6 +94,17 @@ class TestFodselsNummerChecker:
         # Wrong format
         assert checker.check("99999999999") is False
 
+    def test_precheck_skips_regex(self):
+        """Test that inputs of the wrong length or with non-digits never reach the regex."""
+        checker = FodselsNummerChecker()
+
+        with patch("validate_secrets.validators.fodselsnummer._match_fodselsnummer") as mock_match:
+            assert checker.check("123") is False
+            assert checker.check("0101011234x") is False
+            assert list(checker.check_many(["0101011234", "abcdefghijk"])) == [False, False]
+
+        mock_match.assert_not_called()
+
     def test_valid_format_structure(self):
         """Test that properly formatted numbers are processed."""
         checker = FodselsNummerChecker()
@@ -73,6 +114,44 @@ class TestFodselsNummerChecker:
         # Should return False for invalid number, not None (which means invalid format)
         assert result is False
 
+    def test_control_digit(self):
+        """Test that the last digit must match the control digit of the first nine."""
+        checker = FodselsNummerChecker()
+
+        assert checker.check("01010110005") is True
+        assert checker.check("010101 100 05") is True
+        assert checker.check("01010110006") is False
+
+    def test_check_many_preserves_order(self):
+        """Test that batch checks yield results in input order."""
+        checker = FodselsNummerChecker()
+
+        numbers = ["123", "01010112345", "abcdefghijk"]
+        results = list(checker.check_many(numbers, max_workers=2))
+
+        assert results == [checker.check(n) for n in numbers]
+
+    def test_check_many_matches_check(self):
+        """Test that the batch fast path agrees with check() on valid and invalid numbers."""
+        checker = FodselsNummerChecker()
+
+        numbers = [f"010101{i:03d}{c}5" for i in range(100, 130) for c in range(10)]
+        numbers += ["010101 123 45", "123", "abcdefghijk", "99999999999"]
+        results = list(checker.check_many(numbers))
+
+        assert results == [checker.check(n) for n in numbers]
+        assert True in results
+
+    def test_check_many_runs_without_thread_pool(self):
+        """Test that batch checks run in the calling thread."""
+        checker = FodselsNummerChecker()
+
+        with patch("validate_secrets.core.base.ThreadPoolExecutor") as mock_executor:
+            results = list(checker.check_many(["01010112345", "123"]))
+
+        mock_executor.assert_not_called()
+        assert len(results) == 2
+
 
 class TestGoogleApiKeyChecker:
     """Test the Google API key validator."""
@@ -90,6 +169,17 @@ class TestGoogleApiKeyChecker:
         # Invalid characters
         assert checker.check("AIzaSy!" * 10) is None
 
+    def test_invalid_format_skips_request(self):
+        """Test that keys failing the format check never reach the API."""
+        checker = GoogleApiKeyChecker()
+
+        with patch.object(checker.session, "send") as mock_send:
+            assert checker.check("random-string") is None
+            assert checker.check("BIzaSyA" + "B" * 32) is None
+            assert checker.check("AIzaSyA" + "!" * 32) is None
+
+        mock_send.assert_not_called()
+
     def test_valid_format_structure(self):
         """Test that properly formatted keys are processed."""
         checker = GoogleApiKeyChecker()
@@ -100,6 +190,49 @@ class TestGoogleApiKeyChecker:
         # Should make an API call and return True/False/None, not fail on format
         assert result in [True, False, None]
 
+    def test_uses_session(self):
+        """Test that checks send copies of one prepared request through the pooled session."""
+        checker = GoogleApiKeyChecker()
+        fake_key = "AIzaSyA" + "B" * 32
+
+        with patch.object(checker.session, "send") as mock_send:
+            mock_send.return_value = MagicMock(
+                status_code=200,
+                json=MagicMock(
+                    return_value={
+                        "status": "REQUEST_DENIED",
+                        "error_message": "The provided API key is invalid. ",
+                    }
+                ),
+            )
+            assert checker.check(fake_key) is False
+
+        mock_send.assert_called_once()
+        assert mock_send.call_args.args[0].url == GOOGLE_MAPS_URL + fake_key
+        assert checker._request_template.url == GOOGLE_MAPS_URL
+
+    def test_uses_environment_ca_bundle(self, monkeypatch):
+        """Test that REQUESTS_CA_BUNDLE applies to the prepared requests."""
+        monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/etc/ssl/proxy-ca.pem")
+        checker = GoogleApiKeyChecker()
+
+        with patch.object(checker.session, "send") as mock_send:
+            mock_send.return_value = MagicMock(status_code=500)
+            checker.check("AIzaSyA" + "C" * 32)
+
+        assert mock_send.call_args.kwargs["verify"] == "/etc/ssl/proxy-ca.pem"
+
+    def test_session_pools_and_retries(self):
+        """Test that the session keeps a connection pool and retries gateway errors."""
+        adapter = GoogleApiKeyChecker().session.get_adapter(GOOGLE_MAPS_URL)
+
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 2
+        assert 503 in adapter.max_retries.status_forcelist
+        # A request that timed out reading may already have been handled
+        assert adapter.max_retries.read == 0
+        assert not adapter.max_retries.raise_on_status
+
 
 class TestOfficeWebHookChecker:
     """Test the Office webhook validator."""
@@ -117,6 +250,20 @@ class TestOfficeWebHookChecker:
         # Wrong path
         assert checker.check("https://test.webhook.office.com/wrong-path") is None
 
+        # Trailing newline, which "$" alone would accept
+        assert checker.check("https://test.webhook.office.com/webhookb2/fake-id\n") is None
+
+    def test_explicit_port_accepted(self):
+        """Test that a webhook URL with an explicit port passes the format check."""
+        checker = OfficeWebHookChecker()
+        url = "https://test.webhook.office.com:443/webhookb2/fake-id"
+
+        with patch.object(checker.session, "head") as mock_head:
+            mock_head.return_value = MagicMock(status_code=410)
+            assert checker.check(url) is False
+
+        assert mock_head.call_args.args[0] == url
+
     def test_valid_format_structure(self):
         """Test that properly formatted webhook URLs are processed."""
         checker = OfficeWebHookChecker()
@@ -127,6 +274,81 @@ class TestOfficeWebHookChecker:
         # Should make an API call and return True/False/None
         assert result in [True, False, None]
 
+    def test_gone_webhook_skips_post(self):
+        """Test that a 410 on the HEAD pre-check returns False without posting."""
+        checker = OfficeWebHookChecker()
+
+        with (
+            patch.object(checker.session, "head") as mock_head,
+            patch.object(checker.session, "post") as mock_post,
+        ):
+            mock_head.return_value = MagicMock(status_code=410)
+
+            assert checker.check("https://test.webhook.office.com/webhookb2/fake-id") is False
+            mock_post.assert_not_called()
+
+    def test_check_many_screens_before_dispatch(self):
+        """Test that only well-formed webhooks reach check(), with results kept in order."""
+        checker = OfficeWebHookChecker()
+        webhook = "https://test.webhook.office.com/webhookb2/fake-id"
+
+        with patch.object(OfficeWebHookChecker, "check", return_value=True) as mock_check:
+            results = list(checker.check_many(["not-a-url", webhook, "https://example.com/x"]))
+
+        assert results == [None, True, None]
+        mock_check.assert_called_once_with(webhook)
+
+    def test_check_many_screens_lazily(self):
+        """Test that URLs are pulled from the input as results are consumed."""
+        checker = OfficeWebHookChecker()
+        consumed = []
+
+        def urls():
+            for i in range(100):
+                consumed.append(i)
+                yield (
+                    "not-a-url" if i % 3 == 0 else f"https://test.webhook.office.com/webhookb2/{i}"
+                )
+
+        with patch.object(OfficeWebHookChecker, "check", side_effect=lambda url: url):
+            results = checker.check_many(urls(), max_workers=2)
+            assert next(results) is None
+            assert next(results) == "https://test.webhook.office.com/webhookb2/1"
+            assert len(consumed) < 20
+
+            rest = list(results)
+
+        assert len(rest) == 98
+        # 99 is not a webhook, so it is answered after the last check
+        assert rest[-2:] == ["https://test.webhook.office.com/webhookb2/98", None]
+
+    def test_check_many_without_local_dns(self):
+        """Test that webhooks are still dispatched when only a proxy can resolve their hosts."""
+        checker = OfficeWebHookChecker()
+        urls = [
+            "https://test.webhook.office.com/webhookb2/fake-id-1",
+            "https://test.webhook.office.com/webhookb2/fake-id-2",
+        ]
+
+        with (
+            patch("socket.getaddrinfo", side_effect=OSError("Name or service not known")),
+            patch.object(OfficeWebHookChecker, "check", return_value=True) as mock_check,
+        ):
+            assert list(checker.check_many(urls)) == [True, True]
+
+        assert mock_check.call_count == 2
+
+    def test_body_is_prebuilt(self):
+        """Test that the POST body is serialized once, depending only on notify."""
+        assert OfficeWebHookChecker()._body == b"{}"
+
+        notify_body = json.loads(OfficeWebHookChecker(notify=True)._body)
+        assert notify_body["@type"] == "MessageCard"
+        assert notify_body["text"]
+
+        # Shared by every instance rather than re-encoded per checker
+        assert OfficeWebHookChecker(notify=True)._body is OfficeWebHookChecker(notify=True)._body
+
 
 class TestSnykAPITokenChecker:
     """Test the Snyk API token validator."""
@@ -141,50 +363,135 @@ class TestSnykAPITokenChecker:
         # Should make an API call and return True/False/None
         assert result in [True, False, None]
 
+    def test_repeat_checks_are_cached(self):
+        """Test that a definitive result is reused and errors are retried."""
+        checker = SnykAPITokenChecker()
+
+        with patch.object(checker.session, "send") as mock_send:
+            mock_send.return_value = MagicMock(status_code=401, text="Unauthorized")
+            assert checker.check("token-a") is False
+            assert checker.check("token-a") is False
+            assert mock_send.call_count == 1
+
+            mock_send.return_value = MagicMock(status_code=500, text="Server Error")
+            assert checker.check("token-b") is None
+            assert checker.check("token-b") is None
+            assert mock_send.call_count == 3
+
+        assert b"token-a" not in b"".join(checker._result_cache)
+
+    def test_requests_share_prepared_template(self):
+        """Test that each check sends its own token on a copy of the prepared request."""
+        checker = SnykAPITokenChecker()
+
+        with patch.object(checker.session, "send") as mock_send:
+            mock_send.return_value = MagicMock(status_code=200, text="{}")
+            checker.check("token-a")
+            checker.check("token-b")
+
+        sent = [call.args[0] for call in mock_send.call_args_list]
+        assert [r.headers["Authorization"] for r in sent] == ["token token-a", "token token-b"]
+        assert sent[0].headers["Content-Type"] == "application/vnd.api+json"
+        assert "Authorization" not in checker._request_template.headers
+
+    def test_connection_reused(self, keepalive_server):
+        """Test that consecutive checks share one keep-alive connection."""
+        url, ports = keepalive_server
+        checker = SnykAPITokenChecker()
+        checker._api = url
+
+        for i in range(5):
+            assert checker.check(f"token-{i}") is True
+
+        assert len(ports) == 1
+
+
+class TestCheckMany:
+    """Test the thread pool batch check shared by HTTP validators."""
+
+    def test_input_consumed_in_bounded_window(self):
+        """Test that secrets are pulled from the input as results are consumed."""
+        checker = SnykAPITokenChecker()
+        consumed = []
+
+        def tokens():
+            for i in range(100):
+                consumed.append(i)
+                yield f"token-{i}"
+
+        with patch.object(SnykAPITokenChecker, "check", side_effect=lambda token: token):
+            results = checker.check_many(tokens(), max_workers=4)
+            assert next(results) == "token-0"
+            assert len(consumed) <= 4 * 2 + 1
+
+            assert list(results) == [f"token-{i}" for i in range(1, 100)]
+
+
+class TestCheckerTimeouts:
+    """Test the timeout helpers shared by HTTP validators."""
+
+    def test_timeout_until_caps_connect(self):
+        """Test that the connect timeout is capped and read gets the remaining budget."""
+        checker = FodselsNummerChecker(timeout=30)
+
+        connect, read = checker.timeout_until(time.monotonic() + 30)
+        assert connect == CONNECT_TIMEOUT
+        assert 29 < read <= 30
+
+    def test_timeout_until_expired_deadline(self):
+        """Test that an expired deadline still yields a small positive timeout."""
+        checker = FodselsNummerChecker()
+
+        assert checker.timeout_until(time.monotonic() - 1) == (0.1, 0.1)
+
+
+@pytest.fixture(scope="module")
+def validators():
+    """One instance of every validator, shared by the metadata tests."""
+    return [
+        DatabricksTokenChecker(host_url="https://test.databricks.com"),
+        FodselsNummerChecker(),
+        GoogleApiKeyChecker(),
+        OfficeWebHookChecker(),
+        SnykAPITokenChecker(),
+    ]
+
 
 class TestValidatorMetadata:
     """Test validator metadata and attributes."""
 
-    def test_all_validators_have_names(self):
-        """Test that all validators have proper names."""
-        validators = [
-            DatabricksTokenChecker(host_url="https://test.databricks.com"),
-            FodselsNummerChecker(),
-            GoogleApiKeyChecker(),
-            OfficeWebHookChecker(),
-            SnykAPITokenChecker(),
-        ]
-
+    @pytest.mark.parametrize("attr", ["name", "description"])
+    def test_all_validators_have_attribute(self, validators, attr):
+        """Test that all validators have a non-empty name and description."""
         for validator in validators:
-            assert hasattr(validator, "name")
-            assert validator.name
-            assert isinstance(validator.name, str)
-
-    def test_all_validators_have_descriptions(self):
-        """Test that all validators have descriptions."""
-        validators = [
-            DatabricksTokenChecker(host_url="https://test.databricks.com"),
-            FodselsNummerChecker(),
-            GoogleApiKeyChecker(),
-            OfficeWebHookChecker(),
-            SnykAPITokenChecker(),
-        ]
+            value = getattr(validator, attr)
+            assert value
+            assert isinstance(value, str)
 
+    def test_metadata_method(self, validators):
+        """Test the get_metadata method."""
         for validator in validators:
-            assert hasattr(validator, "description")
-            assert validator.description
-            assert isinstance(validator.description, str)
+            metadata = validator.get_metadata()
 
-    def test_metadata_method(self):
-        """Test the get_metadata method."""
-        validator = FodselsNummerChecker()
-        metadata = validator.get_metadata()
-
-        assert isinstance(metadata, dict)
-        assert "name" in metadata
-        assert "description" in metadata
-        assert "class" in metadata
-        assert "module" in metadata
+            assert isinstance(metadata, dict)
+            assert "name" in metadata
+            assert "description" in metadata
+            assert "class" in metadata
+            assert "module" in metadata
+
+    def test_metadata_from_class(self):
+        """Test that metadata is available without creating a validator."""
+        metadata = SnykAPITokenChecker.get_metadata()
+
+        assert metadata["name"] == "snyk_api_token"
+        assert metadata["class"] == "SnykAPITokenChecker"
+
+    def test_session_created_on_first_use(self):
+        """Test that HTTP validators only open a session when it is needed."""
+        checker = GoogleApiKeyChecker()
+
+        assert "session" not in checker.__dict__
+        assert checker.session is checker.session
 
 
 if __name__ == "__main__":